@@ -20,8 +20,9 @@ from magtrack.simulation import simulate_beads
 
 from magscope.datatypes import BufferUnderflow, VideoBuffer
 from magscope.ipc import register_ipc_command
-from magscope.ipc_commands import (GetCameraSettingCommand, SetCameraSettingCommand,
-                                    SetSimulatedFocusCommand, UpdateCameraSettingCommand,
+from magscope.ipc_commands import (GetCameraSettingCommand, GetCameraSettingsCommand,
+                                    SetCameraSettingCommand, SetSimulatedFocusCommand,
+                                    UpdateCameraSettingCommand, UpdateCameraSettingsCommand,
                                     UpdateVideoBufferPurgeCommand)
 from magscope.processes import ManagerProcessBase
 
@@ -61,8 +62,7 @@ class CameraManager(ManagerProcessBase):
 
         # Send the current camera settings to the GUI
         if self.camera.is_connected:
-            for setting in self.camera.settings:
-                self.get_camera_setting(setting)
+            self.get_camera_settings(tuple(self.camera.settings))
 
     def do_main_loop(self):
         """Main process loop handling buffer lifecycle and fetching frames.
@@ -152,6 +152,13 @@ class CameraManager(ManagerProcessBase):
         command = UpdateCameraSettingCommand(name=name, value=value)
         self.send_ipc(command)
 
+    @register_ipc_command(GetCameraSettingsCommand)
+    def get_camera_settings(self, names: tuple[str, ...]):
+        """Send several camera setting values to the GUI in one IPC message."""
+        values = {name: self.camera[name] for name in names}
+        command = UpdateCameraSettingsCommand(values=values)
+        self.send_ipc(command)
+
     @register_ipc_command(SetCameraSettingCommand)
     def set_camera_setting(self, name: str, value: str):
         """Apply a setting to the camera and broadcast the full settings set."""
@@ -162,8 +169,7 @@ class CameraManager(ManagerProcessBase):
             if not reason:
                 reason = repr(e)
             warn(f'Could not set camera setting {name} to {value}: {reason}')
-        for setting in self.camera.settings:
-            self.get_camera_setting(setting)
+        self.get_camera_settings(tuple(self.camera.settings))
 
     @register_ipc_command(SetSimulatedFocusCommand)
     def set_simulated_focus(self, offset: float):
@@ -13,11 +13,12 @@ camera frames and other numeric data without copying large arrays:
     motor telemetry. Like :class:`VideoBuffer`, it uses shared memory.
 
 Both buffers rely on external :class:`multiprocessing.synchronize.Lock`
-objects to coordinate access between processes. See the class docstrings
-below for usage details.
+objects to coordinate access between processes, and keep their read, write
+and unread-count indexes in a shared :class:`RingIndex`. See the class
+docstrings below for usage details.
 """
 
-import struct
+import ctypes
 from multiprocessing.shared_memory import SharedMemory
 from multiprocessing.synchronize import Lock
 
@@ -27,6 +28,64 @@ from ._logging import get_logger
 
 logger = get_logger("datatypes")
 
+class RingIndex:
+    """Read, write and unread-count indexes of a shared-memory ring buffer.
+
+    The three values live in a 24 byte shared-memory segment as little-endian
+    ``uint64`` in the order ``(read, write, count)``. Indexes wrap at
+    ``modulus``, which is expressed in whatever unit the owning buffer uses
+    (frames for :class:`VideoBuffer`, bytes for :class:`MatrixBuffer`).
+
+    The class does no locking of its own; callers must hold the owning
+    buffer's lock around any read-modify-write sequence.
+    """
+
+    SIZE = 24
+
+    def __init__(self, buf: memoryview, modulus: int):
+        self._values = np.ndarray((3,), dtype='<u8', buffer=buf)
+        self.modulus = modulus
+
+    @property
+    def read(self) -> int:
+        return int(self._values[0])
+
+    @property
+    def write(self) -> int:
+        return int(self._values[1])
+
+    @property
+    def count(self) -> int:
+        return int(self._values[2])
+
+    def free(self) -> int:
+        """Return the number of units that can be written without overwriting."""
+        return self.modulus - self.count
+
+    def reset(self) -> None:
+        self._values[:] = 0
+
+    def advance_read(self, n: int) -> None:
+        """Consume ``n`` unread units."""
+        self._values[0] = (int(self._values[0]) + n) % self.modulus
+        self._values[2] = int(self._values[2]) - n
+
+    def advance_write(self, n: int) -> None:
+        """Publish ``n`` newly written units.
+
+        If the write overran unread data, the oldest units are dropped: the
+        read index moves up to the write index and the count saturates at
+        ``modulus``.
+        """
+        write = (int(self._values[1]) + n) % self.modulus
+        count = int(self._values[2]) + n
+        self._values[1] = write
+        if count > self.modulus:
+            self._values[0] = write
+            count = self.modulus
+        self._values[2] = count
+
+
 class VideoBuffer:
     """Shared memory ring buffer for video data
 
@@ -79,17 +138,17 @@ class VideoBuffer:
             if any(param is None for param in [n_stacks, width, height, n_images, bits]):
                 raise ValueError("VideoBuffer misconfigured")
             self.n_stacks = n_stacks
-            self._shm_info.buf[0:8] = int(n_stacks).to_bytes(8, byteorder='big')
-            self._shm_info.buf[8:16] = int(width).to_bytes(8, byteorder='big')
-            self._shm_info.buf[16:24] = int(height).to_bytes(8, byteorder='big')
-            self._shm_info.buf[24:32] = int(n_images).to_bytes(8, byteorder='big')
-            self._shm_info.buf[32:40] = int(bits).to_bytes(8, byteorder='big')
+            self._shm_info.buf[0:8] = int(n_stacks).to_bytes(8, byteorder='little')
+            self._shm_info.buf[8:16] = int(width).to_bytes(8, byteorder='little')
+            self._shm_info.buf[16:24] = int(height).to_bytes(8, byteorder='little')
+            self._shm_info.buf[24:32] = int(n_images).to_bytes(8, byteorder='little')
+            self._shm_info.buf[32:40] = int(bits).to_bytes(8, byteorder='little')
         else:
-            self.n_stacks = int.from_bytes(self._shm_info.buf[0:8], byteorder='big')
-            width = int.from_bytes(self._shm_info.buf[8:16], byteorder='big')
-            height = int.from_bytes(self._shm_info.buf[16:24], byteorder='big')
-            n_images = int.from_bytes(self._shm_info.buf[24:32], byteorder='big')
-            bits = int.from_bytes(self._shm_info.buf[32:40], byteorder='big')
+            self.n_stacks = int.from_bytes(self._shm_info.buf[0:8], byteorder='little')
+            width = int.from_bytes(self._shm_info.buf[8:16], byteorder='little')
+            height = int.from_bytes(self._shm_info.buf[16:24], byteorder='little')
+            n_images = int.from_bytes(self._shm_info.buf[24:32], byteorder='little')
+            bits = int.from_bytes(self._shm_info.buf[32:40], byteorder='little')
 
         # Setup more meta-data
         self.stack_shape = (width, height, n_images)
@@ -113,16 +172,19 @@ class VideoBuffer:
             name=self.name + ' Timestamps',
             size=8 * self.n_total_images)
         self._idx_shm = SharedMemory(
-            create=create, name=self.name + ' Index', size=24)
+            create=create, name=self.name + ' Index', size=RingIndex.SIZE)
         self._buf = self._shm.buf
         self._ts_buf = self._ts_shm.buf
-        self._idx_buf = self._idx_shm.buf
+        self._index = RingIndex(self._idx_shm.buf, self.n_total_images)
+        # Raw addresses for ctypes.memmove writes. They are taken through a
+        # temporary NumPy view rather than ctypes.from_buffer so that no buffer
+        # export is held open, which would make SharedMemory.close() fail.
+        self._buf_ptr = _shared_memory_address(self._buf)
+        self._ts_ptr = _shared_memory_address(self._ts_buf)
 
         # Initialise the buffer and indexes when creating for the first time
         if create:
-            self._set_read_index(0)
-            self._set_write_index(0)
-            self._set_count_index(0)
+            self._index.reset()
 
     def __del__(self):
         if hasattr(self, '_shm'):
@@ -132,32 +194,12 @@ class VideoBuffer:
         if hasattr(self, '_shm_info'):
             self._shm_info.close()
 
-    def _get_count_index(self):
-        return int.from_bytes(self._idx_buf[16:24], byteorder='big')
-
-    def _get_read_index(self):
-        return int.from_bytes(self._idx_buf[0:8], byteorder='big')
-
-    def _get_write_index(self):
-        return int.from_bytes(self._idx_buf[8:16], byteorder='big')
-
-    def _set_count_index(self, value):
-        self._idx_buf[16:24] = int(value).to_bytes(8, byteorder='big')
-
-    def _set_read_index(self, value):
-        value = value % self.n_total_images
-        self._idx_buf[0:8] = int(value).to_bytes(8, byteorder='big')
-
-    def _set_write_index(self, value):
-        value = value % self.n_total_images
-        self._idx_buf[8:16] = int(value).to_bytes(8, byteorder='big')
-
     def _check_read(self, value):
-        if value > self._get_count_index():
+        if value > self._index.count:
             raise BufferUnderflow('BufferUnderflow')
 
     def _check_write(self, value):
-        if value > (self.n_total_images - self._get_count_index()):
+        if value > self._index.free():
             raise BufferOverflow('BufferOverflow')
 
     def _get_timestamps(self, read, length):
@@ -165,8 +207,25 @@ class VideoBuffer:
         return np.ndarray((length, ), dtype='float64', buffer=buf)
 
     def _set_timestamp(self, write, timestamp):
-        self._ts_buf[(write * 8):((write + 1) * 8)] = struct.pack(
-            'd', timestamp)
+        ctypes.c_double.from_address(self._ts_ptr + write * 8).value = timestamp
+
+    def _frame_source(self, image):
+        """Return ``(frame, src)`` for a ``ctypes.memmove`` frame copy.
+
+        ``src`` points at the frame bytes and ``frame`` is the object that owns
+        them, which the caller must keep alive until the copy is done.
+        """
+        if isinstance(image, bytes):
+            nbytes = len(image)
+            src = image
+        else:
+            image = np.ascontiguousarray(image)
+            nbytes = image.nbytes
+            src = image.ctypes.data
+        if nbytes != self.image_size:
+            raise ValueError(
+                f'Image has {nbytes} bytes but the buffer expects {self.image_size}')
+        return image, src
 
     def get_level(self):
         """Return the fraction of the buffer that currently holds data.
@@ -177,12 +236,12 @@ class VideoBuffer:
             Ratio between unread frames and total buffer capacity.
         """
         with self.lock:
-            return self._get_count_index() / self.n_total_images
+            return self._index.count / self.n_total_images
 
     def get_unread_stack_count(self):
         """Return the number of full unread stacks currently buffered."""
         with self.lock:
-            return self._get_count_index() // self.n_images
+            return self._index.count // self.n_images
 
     def check_read_stack(self):
         """Return ``True`` when at least one full stack can be read.
@@ -215,10 +274,28 @@ class VideoBuffer:
             image bytes. Convert the memory view to a 2D array with
             ``dtype`` and ``image_shape``.
         """
-        read = (self._get_write_index() - 1) % self.n_total_images
+        read = (self._index.write - 1) % self.n_total_images
         return read, self._buf[(read * self.image_size):((read + 1) *
                                                          self.image_size)]
 
+    def peak_image_array(self):
+        """Return the newest image as a zero-copy array without the lock.
+
+        Like :meth:`peak_image`, the frame may occasionally be partially
+        written or older than expected. The array is a view into shared
+        memory, so copy it before keeping it beyond the current frame.
+
+        Returns
+        -------
+        tuple of (int, numpy.ndarray)
+            Tuple containing the newest image index and a read-only view of
+            the frame with shape ``(height, width)``, i.e. indexed ``(Y, X)``.
+        """
+        read, image_bytes = self.peak_image()
+        image = np.ndarray(self.image_shape[::-1], dtype=self.dtype, buffer=image_bytes)
+        image.flags.writeable = False
+        return read, image
+
     def peak_stack(self):
         """Return the next unread stack without advancing the read index.
 
@@ -231,7 +308,7 @@ class VideoBuffer:
         """
         with self.lock:
             self._check_read(self.n_images)
-            read = self._get_read_index()
+            read = self._index.read
             stack_bytes = self._buf[(read *
                                      self.image_size):((read + self.n_images) *
                                                        self.image_size)]
@@ -254,10 +331,7 @@ class VideoBuffer:
         """
         with self.lock:
             self._check_read(self.n_images)
-            read = self._get_read_index()
-            count = self._get_count_index()
-            self._set_read_index(read + self.n_images)
-            self._set_count_index(count - self.n_images)
+            self._index.advance_read(self.n_images)
 
     def read_image(self):
         """Return the next unread image and its timestamp.
@@ -270,10 +344,8 @@ class VideoBuffer:
         """
         with self.lock:
             self._check_read(1)
-            read = self._get_read_index()
-            count = self._get_count_index()
-            self._set_read_index(read + 1)
-            self._set_count_index(count - 1)
+            read = self._index.read
+            self._index.advance_read(1)
             image_bytes = self._buf[(read * self.image_size):((read + 1) *
                                                               self.image_size)]
             trans_image = np.ndarray(self.image_shape[::-1],
@@ -294,31 +366,34 @@ class VideoBuffer:
         """
         with self.lock:
             self._check_write(1)
-            write = self._get_write_index()
-            count = self._get_count_index()
+            write = self._index.write
             self._set_timestamp(write, timestamp)
-            self._set_write_index(write + 1)
-            self._set_count_index(count + 1)
+            self._index.advance_write(1)
 
     def write_image_and_timestamp(self, image, timestamp):
         """Increment the write index, storing one image and its timestamp.
 
         Parameters
         ----------
-        image : numpy.ndarray
-            Frame data shaped ``(width, height)`` with the buffer's ``dtype``.
+        image : bytes or numpy.ndarray
+            Raw frame bytes, or frame data with the buffer's ``dtype`` laid out
+            as the camera delivers it (``(height, width)`` in C order).
         timestamp : float
             Timestamp in seconds associated with the frame.
         """
+        # This runs once per camera frame. The frame is validated before the
+        # lock is taken so the critical section is just the index bookkeeping
+        # and two memmoves.
+        image, src = self._frame_source(image)
+        image_size = self.image_size
+        index = self._index
         with self.lock:
-            self._check_write(1)
-            write = self._get_write_index()
-            count = self._get_count_index()
-            self._buf[(write * self.image_size):((write + 1) *
-                                                 self.image_size)] = image
+            if index.free() < 1:
+                raise BufferOverflow('BufferOverflow')
+            write = index.write
+            ctypes.memmove(self._buf_ptr + write * image_size, src, image_size)
             self._set_timestamp(write, timestamp)
-            self._set_write_index(write + 1)
-            self._set_count_index(count + 1)
+            index.advance_write(1)
 
 class MatrixBuffer:
     """Shared-memory ring buffer for 2D numeric data.
@@ -364,11 +439,11 @@ class MatrixBuffer:
             self.shape = shape
             r: int = self.shape[0]
             c: int = self.shape[1]
-            self._shm_info.buf[0:8] = int(r).to_bytes(8, byteorder='big')
-            self._shm_info.buf[8:16] = int(c).to_bytes(8, byteorder='big')
+            self._shm_info.buf[0:8] = int(r).to_bytes(8, byteorder='little')
+            self._shm_info.buf[8:16] = int(c).to_bytes(8, byteorder='little')
         else:
-            r: int = int.from_bytes(self._shm_info.buf[0:8], byteorder='big')
-            c: int = int.from_bytes(self._shm_info.buf[8:16], byteorder='big')
+            r: int = int.from_bytes(self._shm_info.buf[0:8], byteorder='little')
+            c: int = int.from_bytes(self._shm_info.buf[8:16], byteorder='little')
             self.shape: tuple[int, int] = (r, c)
 
         # Setup more meta-data
@@ -381,42 +456,21 @@ class MatrixBuffer:
         self._shm = SharedMemory(
             create=create, name=self.name, size=self.nbytes)
         self._idx_shm = SharedMemory(
-            create=create, name=self.name + ' Index', size=24)
+            create=create, name=self.name + ' Index', size=RingIndex.SIZE)
         self._buf = self._shm.buf
-        self._idx_buf = self._idx_shm.buf
+        self._buf_ptr = _shared_memory_address(self._buf)
+        self._index = RingIndex(self._idx_shm.buf, self.nbytes)
 
         # Initialise the buffer and indexes when creating for the first time
         if create:
-            self._set_read_index(0)
-            self._set_write_index(0)
-            self._set_count_index(0)
+            self._index.reset()
             self.write(np.ones(shape, dtype=self.dtype) + np.nan)
-            self._set_count_index(0)
+            self._index.reset()
 
     def __del__(self):
         self._shm.close()
         self._idx_shm.close()
 
-    def _get_count_index(self):
-        return int.from_bytes(self._idx_buf[16:24], byteorder='big')
-
-    def _get_read_index(self):
-        return int.from_bytes(self._idx_buf[0:8], byteorder='big')
-
-    def _get_write_index(self):
-        return int.from_bytes(self._idx_buf[8:16], byteorder='big')
-
-    def _set_count_index(self, value):
-        self._idx_buf[16:24] = int(value).to_bytes(8, byteorder='big')
-
-    def _set_read_index(self, value):
-        value = value % self.nbytes
-        self._idx_buf[0:8] = int(value).to_bytes(8, byteorder='big')
-
-    def _set_write_index(self, value):
-        value = value % self.nbytes
-        self._idx_buf[8:16] = int(value).to_bytes(8, byteorder='big')
-
     def get_count_index(self):
         """Return the number of unread bytes currently stored in the buffer.
 
@@ -427,7 +481,7 @@ class MatrixBuffer:
             indices.
         """
         with self.lock:
-            return self._get_count_index()
+            return self._index.count
 
     def get_read_index(self):
         """Return the index of the next byte that will be read.
@@ -439,7 +493,7 @@ class MatrixBuffer:
             operation.
         """
         with self.lock:
-            return self._get_read_index()
+            return self._index.read
 
     def get_write_index(self):
         """Return the index of the next byte that will be written.
@@ -451,7 +505,7 @@ class MatrixBuffer:
             operation.
         """
         with self.lock:
-            return self._get_write_index()
+            return self._index.write
 
     def write(self, np_array):
         """Write ``np_array`` into the buffer, advancing the write index.
@@ -464,51 +518,73 @@ class MatrixBuffer:
         """
         assert np_array.shape[0] <= self.shape[0]
         assert np_array.shape[1] == self.shape[1]
+        np_array = np.ascontiguousarray(np_array, dtype=self.dtype)
+        src = np_array.ctypes.data
         with self.lock:
-            write = self._get_write_index()
-            count = self._get_count_index()
+            write = self._index.write
             r = min(np_array.nbytes, self.nbytes - write)
             l = np_array.nbytes - r
-            self._buf[write:(write + r)] = np.ravel(np_array).view('uint8')[0:r].tobytes()  # right
-            self._buf[0:l] = np.ravel(np_array).view('uint8')[r:].tobytes()  # left
-            self._set_write_index(write + np_array.nbytes)
-            self._set_count_index(count + np_array.nbytes)
+            ctypes.memmove(self._buf_ptr + write, src, r)  # right
+            ctypes.memmove(self._buf_ptr, src + r, l)  # left
+            self._index.advance_write(np_array.nbytes)
 
-    def read(self):
+    def read(self, out: np.ndarray | None = None):
         """Return unread rows as a NumPy array and reset the read counter.
 
+        Parameters
+        ----------
+        out : numpy.ndarray, optional
+            Preallocated ``float64`` array with ``shape[1]`` columns and at
+            least as many rows as are unread (``shape`` is always enough).
+            When provided, the unread rows are copied into its leading rows
+            and a view of that prefix is returned, so callers that poll the
+            buffer repeatedly can avoid allocating a new array on every call.
+            The returned view is only valid until ``out`` is reused.
+
         Returns
         -------
         numpy.ndarray
             Copy of the unread rows ordered chronologically.
+
+        Raises
+        ------
+        ValueError
+            If ``out`` has the wrong dtype or column count, or too few rows.
+            The unread rows stay unread.
         """
         with self.lock:
-            count = self._get_count_index()
-            read = self._get_read_index()
-            write = self._get_write_index()
-            assert count >= 0
-            self._set_read_index(read + count)
-            self._set_count_index(0)
-
-            # Does the unread portion wrap around the end of the _buf
-            if read <= write:  # no wrap
-                n = count // self.shape[1] // self.itemsize
-                return np.ndarray(shape=(n, self.shape[1]),
+            count = self._index.count
+            read = self._index.read
+
+            # The unread portion may wrap around the end of the _buf, in which
+            # case it is copied as a right (tail) part followed by a left part
+            row_nbytes = self.shape[1] * self.itemsize
+            right_nbytes = min(count, self.nbytes - read)
+            r = right_nbytes // row_nbytes
+            l = (count - right_nbytes) // row_nbytes
+            if out is None:
+                out = np.empty((r + l, self.shape[1]), dtype=self.dtype)
+            elif (
+                out.dtype != self.dtype
+                or out.ndim != 2
+                or out.shape[1] != self.shape[1]
+                or out.shape[0] < r + l
+            ):
+                raise ValueError(
+                    f'out must be a {self.dtype} array with {self.shape[1]} columns '
+                    f'and at least {r + l} rows, got {out.dtype} {out.shape}'
+                )
+            rows = out[:r + l]
+            rows[:r] = np.ndarray(shape=(r, self.shape[1]),
                                   dtype=self.dtype,
-                                  buffer=self._buf[read:(read +
-                                                         count)]).copy()
-            else:  # wrap
-                right = self._buf[read:self.nbytes]
-                left = self._buf[0:write]
-                r = len(right) // self.shape[1] // self.itemsize
-                l = len(left) // self.shape[1] // self.itemsize
-                np_array_right = np.ndarray(shape=(r, self.shape[1]),
-                                            dtype=self.dtype,
-                                            buffer=right)
-                np_array_left = np.ndarray(shape=(l, self.shape[1]),
-                                           dtype=self.dtype,
-                                           buffer=left)
-                return np.vstack((np_array_right, np_array_left)).copy()
+                                  buffer=self._buf[read:(read + right_nbytes)])
+            rows[r:] = np.ndarray(shape=(l, self.shape[1]),
+                                  dtype=self.dtype,
+                                  buffer=self._buf[0:(l * row_nbytes)])
+
+            # Only consume the rows once they have been copied out
+            self._index.advance_read(count)
+            return rows
 
     def peak_unsorted(self):
         """Return a view of the buffer without reordering indices.
@@ -531,18 +607,14 @@ class MatrixBuffer:
             indices.
         """
         with self.lock:
-            write = self._get_write_index()
-            right = self._buf[write:self.nbytes]
-            left = self._buf[0:write]
-            r = int(len(right) / self.shape[1] / self.itemsize)
-            l = self.shape[0] - r
-            np_array_right = np.ndarray((r, self.shape[1]),
-                                        dtype=self.dtype,
-                                        buffer=right)
-            np_array_left = np.ndarray((l, self.shape[1]),
-                                       dtype=self.dtype,
-                                       buffer=left)
-            return np.vstack((np_array_right, np_array_left))
+            # Rows from the write index onward are the oldest, so they go first
+            w = self._index.write // self.strides[0]
+            r = self.shape[0] - w
+            ring = np.ndarray(self.shape, dtype=self.dtype, buffer=self._buf)
+            rows = np.empty(self.shape, dtype=self.dtype)
+            rows[:r] = ring[w:]
+            rows[r:] = ring[:w]
+            return rows
 
 
 class BeadRoiBuffer:
@@ -760,12 +832,12 @@ class BeadRoiBuffer:
     def _read_info(self, index: int) -> int:
         start = index * 8
         end = start + 8
-        return int.from_bytes(self._shm_info.buf[start:end], byteorder='big')
+        return int.from_bytes(self._shm_info.buf[start:end], byteorder='little')
 
     def _write_info(self, index: int, value: int) -> None:
         start = index * 8
         end = start + 8
-        self._shm_info.buf[start:end] = int(value).to_bytes(8, byteorder='big')
+        self._shm_info.buf[start:end] = int(value).to_bytes(8, byteorder='little')
 
     def _increment_version(self) -> None:
         self._write_info(3, self._read_info(3) + 1)
@@ -1225,13 +1297,13 @@ class ZLUTSweepDataset:
         field_index = self._INFO_FIELDS[field]
         start = field_index * 8
         end = start + 8
-        return int.from_bytes(self._shm_info.buf[start:end], byteorder='big')
+        return int.from_bytes(self._shm_info.buf[start:end], byteorder='little')
 
     def _write_info(self, field: str, value: int) -> None:
         field_index = self._INFO_FIELDS[field]
         start = field_index * 8
         end = start + 8
-        self._shm_info.buf[start:end] = int(value).to_bytes(8, byteorder='big')
+        self._shm_info.buf[start:end] = int(value).to_bytes(8, byteorder='little')
 
     @classmethod
     def _validate_create_parameters(
@@ -1287,6 +1359,10 @@ class BufferOverflow(Exception):
 class DatasetNotReadyError(Exception):
     """Raised when a shared-memory dataset exists but is not attachable yet."""
 
+def _shared_memory_address(buf: memoryview) -> int:
+    """Return the base address of a writable shared-memory ``memoryview``."""
+    return np.frombuffer(buf, dtype=np.uint8).ctypes.data
+
 bit_to_dtype = {
     8:  np.uint8,
     16: np.uint16,
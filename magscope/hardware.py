@@ -21,6 +21,7 @@ class HardwareManagerBase(ManagerProcessBase, ABC, metaclass=SingletonABCMeta):
         super().__init__()
         self.buffer_shape = (1000, 2)
         self._buffer: MatrixBuffer | None = None
+        self._save_rows: np.ndarray | None = None
         self._is_connected: bool = False
 
     def setup(self):
@@ -29,6 +30,8 @@ class HardwareManagerBase(ManagerProcessBase, ABC, metaclass=SingletonABCMeta):
             locks=self.locks,
             name=self.name,
         )
+        # Reused by every save poll so draining the buffer does not allocate
+        self._save_rows = np.empty(self._buffer.shape, dtype=self._buffer.dtype)
 
     def do_main_loop(self):
         self.fetch()
@@ -61,14 +64,17 @@ class HardwareManagerBase(ManagerProcessBase, ABC, metaclass=SingletonABCMeta):
         if not self._acquisition_dir_on or not self._acquisition_dir or self._buffer is None:
             return
 
-        rows = self._buffer.read()
+        rows = self._buffer.read(out=self._save_rows)
         if rows.size == 0:
             return
 
         # Fresh buffers are initialized with NaNs; skip them until real telemetry arrives.
-        rows = rows[np.any(np.isfinite(rows), axis=1)]
-        if rows.size == 0:
-            return
+        # Only then does filtering need a copy, so steady-state polls stay in _save_rows
+        written = np.any(np.isfinite(rows), axis=1)
+        if not written.all():
+            rows = rows[written]
+            if rows.size == 0:
+                return
 
         filepath = self._hardware_save_filepath()
         filepath.parent.mkdir(parents=True, exist_ok=True)
@@ -86,6 +86,11 @@ class UpdateCameraSettingCommand(Command):
     value: str
 
 
+@dataclass(frozen=True)
+class UpdateCameraSettingsCommand(Command):
+    values: dict[str, str]
+
+
 @dataclass(frozen=True)
 class SetSimulatedFocusCommand(Command):
     offset: float
@@ -414,6 +419,11 @@ class GetCameraSettingCommand(Command):
     name: str
 
 
+@dataclass(frozen=True)
+class GetCameraSettingsCommand(Command):
+    names: tuple[str, ...]
+
+
 @dataclass(frozen=True)
 class SetCameraSettingCommand(Command):
     name: str
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, ABCMeta, abstractmethod
+import cProfile
 from ctypes import c_double, c_int, c_uint32, c_uint64, c_uint8
 from multiprocessing import Event, Process, Value
+import os
 import sys
 import traceback
 from typing import TYPE_CHECKING
@@ -95,6 +97,7 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
         self.shared_values: InterprocessValues | None = None
         self._command_registry: CommandRegistry | None = None
         self._command_handlers: dict[type[Command], str] = {}
+        self._profile_dir: str | None = None
 
     @property
     def quitting_event(self) -> EventType:
@@ -109,6 +112,11 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
         }
 
     def get_cached_bead_rois(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return this process's snapshot of bead IDs and ROIs.
+
+        The arrays are replaced, never modified in place, when the ROIs
+        change, so callers may treat them as read-only and compare identity.
+        """
         return self._bead_roi_ids, self._bead_roi_values
 
     def _refresh_bead_roi_cache(self) -> None:
@@ -131,12 +139,14 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
         locks: dict[str, LockType],
         pipe_end: Connection,
         command_registry: CommandRegistry,
+        profile_dir: str | None = None,
     ) -> None:
         """Attach shared references provided by :class:`~magscope.scope.MagScope`.
 
         This centralizes initialization so callers do not need to mutate
         underscored attributes directly when preparing processes before
-        ``start()`` is invoked.
+        ``start()`` is invoked. When ``profile_dir`` is given, ``run()`` is
+        profiled with :mod:`cProfile` and the stats are written there.
         """
         self.camera_type = camera_type
         self.hardware_types = hardware_types
@@ -150,6 +160,7 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
             command_type: spec.handler
             for command_type, spec in command_registry.handlers_for_target(self.name).items()
         }
+        self._profile_dir = profile_dir
 
     def run(self):
         """Start the process when ``start()`` is called.
@@ -166,6 +177,7 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
         logger.info('%s is starting', self.name)
         self._running = True
 
+        profiler = cProfile.Profile() if self._profile_dir is not None else None
         try:
             if self._pipe is None:
                 raise RuntimeError(f'{self.name} has no pipe')
@@ -195,6 +207,9 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
             )
             self._refresh_bead_roi_cache()
 
+            if profiler is not None:
+                profiler.enable()
+
             self.setup()
 
             while self._running:
@@ -204,6 +219,21 @@ class ManagerProcessBase(Process, ABC, metaclass=SingletonABCMeta):
             self._running = False
             self._report_exception(exc)
             raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._dump_profile(profiler)
+
+    def _dump_profile(self, profiler: cProfile.Profile) -> None:
+        """Write this process's profile to ``<profile_dir>/<name>.prof``."""
+        path = os.path.join(self._profile_dir, f'{self.name}.prof')
+        try:
+            os.makedirs(self._profile_dir, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as exc:
+            logger.warning('%s could not write profile to %s: %s', self.name, path, exc)
+            return
+        logger.info('%s wrote profile to %s', self.name, path)
 
     @abstractmethod
     def setup(self):
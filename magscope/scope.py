@@ -30,6 +30,13 @@ invoking :meth:`MagScope.start`::
     >>> scope.add_control(CustomPanel, column=0)
     >>> scope.start()
 
+To find hotspots, pass ``profile_dir``. Each manager process then runs under
+:mod:`cProfile` and writes ``<ManagerName>.prof`` into that directory when it
+exits. The files can be opened with ``pstats``, ``snakeviz`` or converted
+with ``flameprof``::
+
+    >>> scope = MagScope(profile_dir='profiles')
+
 ``MagScope`` constructs the following high-level pipeline:
 
 ``CameraManager`` → ``VideoBuffer`` → ``VideoProcessorManager`` → ``UIManager``
@@ -113,6 +120,7 @@ class MagScope(metaclass=SingletonMeta):
         verbose: bool = False,
         print_ipc_commands: bool = False,
         print_script_commands: bool = False,
+        profile_dir: str | None = None,
     ):
         self.beadlock_manager = BeadLockManager()
         self.camera_manager = CameraManager()
@@ -148,6 +156,7 @@ class MagScope(metaclass=SingletonMeta):
         self._command_registry_initialized: bool = False
         self._print_ipc_commands = print_ipc_commands
         self._print_script_commands = print_script_commands
+        self._profile_dir = profile_dir
 
         self._terminated: bool = False
         self._startup_splash_deadline: float | None = None
@@ -733,6 +742,7 @@ class MagScope(metaclass=SingletonMeta):
                 locks=self.locks,
                 pipe_end=child_pipes[name],
                 command_registry=self.command_registry,
+                profile_dir=self._profile_dir,
             )
             self.quitting_events[name] = proc.quitting_event
 
@@ -27,7 +27,7 @@ from magscope.auto_bead_selection import (
 )
 from magscope.ui.theme import get_accent_color
 from magscope.ui.video_viewer import VideoViewer
-from magscope.ui.widgets import BeadGraphic
+from magscope.ui.widgets import BeadGraphic, signals_blocked
 from magscope.utils import numpy_type_to_qt_image_type
 
 if TYPE_CHECKING:
@@ -409,11 +409,10 @@ class AutoBeadSelectionDialog(QDialog):
         if not self._candidates:
             self._candidate_min_score = 0.0
             self._candidate_max_score = 1.0
-            self.threshold_slider.blockSignals(True)
-            self.threshold_slider.setRange(0, 0)
-            self.threshold_slider.setValue(0)
-            self.threshold_slider.setEnabled(False)
-            self.threshold_slider.blockSignals(False)
+            with signals_blocked(self.threshold_slider):
+                self.threshold_slider.setRange(0, 0)
+                self.threshold_slider.setValue(0)
+                self.threshold_slider.setEnabled(False)
             return
 
         scores = np.asarray([candidate.score for candidate in self._candidates], dtype=np.float64)
@@ -422,11 +421,10 @@ class AutoBeadSelectionDialog(QDialog):
         default_threshold = default_candidate_score_threshold(self._candidates)
         default_value = self._score_to_slider_value(default_threshold)
 
-        self.threshold_slider.blockSignals(True)
-        self.threshold_slider.setRange(0, self.SLIDER_STEPS)
-        self.threshold_slider.setValue(default_value)
-        self.threshold_slider.setEnabled(not np.isclose(self._candidate_min_score, self._candidate_max_score))
-        self.threshold_slider.blockSignals(False)
+        with signals_blocked(self.threshold_slider):
+            self.threshold_slider.setRange(0, self.SLIDER_STEPS)
+            self.threshold_slider.setValue(default_value)
+            self.threshold_slider.setEnabled(not np.isclose(self._candidate_min_score, self._candidate_max_score))
 
     def _score_to_slider_value(self, score: float) -> int:
         if np.isclose(self._candidate_min_score, self._candidate_max_score):
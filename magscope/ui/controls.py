@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import datetime
+import functools
 import importlib.util
 import math
 import os
@@ -15,7 +16,20 @@ import matplotlib
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import numpy as np
-from PyQt6.QtCore import QPointF, QRectF, QSettings, QSize, QTimer, QUrl, Qt, QVariant, pyqtSignal
+from PyQt6.QtCore import (
+    QObject,
+    QPointF,
+    QRectF,
+    QRunnable,
+    QSettings,
+    QSize,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt6.QtGui import (
     QColor,
     QDesktopServices,
@@ -26,7 +40,8 @@ from PyQt6.QtGui import (
     QPen,
     QPixmap,
     QPolygonF,
-    QTextOption,
+    QStandardItem,
+    QStandardItemModel,
 )
 from PyQt6.QtWidgets import (
     QApplication,
@@ -53,16 +68,16 @@ from PyQt6.QtWidgets import (
     QStackedLayout,
     QStackedWidget,
     QTabWidget,
-    QTextEdit,
     QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
+from magscope.hardware import FocusMotorBase
 from magscope.ipc_commands import (
     ExecuteXYLockCommand,
     ExecuteZLockCommand,
-    GetCameraSettingCommand,
+    GetCameraSettingsCommand,
     LoadScriptCommand,
     PauseScriptCommand,
     ResumeScriptCommand,
@@ -103,12 +118,14 @@ from magscope.settings import (
     tracking_options_from_mapping,
     tracking_options_from_qsettings,
 )
+from magscope.ui.dialogs import open_file
 from magscope.ui.search import (
     PanelControlTarget,
     PreferencesSettingTarget,
     PreferencesWidgetTarget,
     SearchTarget,
 )
+from magscope.ui.settings import shared_settings
 from magscope.ui.theme import PANEL_BACKGROUND_COLOR, get_accent_color
 from magscope.ui.widgets import (
     CollapsibleGroupBox,
@@ -116,8 +133,10 @@ from magscope.ui.widgets import (
     LabeledCheckbox,
     LabeledLineEdit,
     LabeledLineEditWithValue,
+    signals_blocked,
+    updates_suspended,
 )
-from magscope.utils import AcquisitionMode, crop_stack_to_rois
+from magscope.utils import AcquisitionMode
 
 # Import only for the type check to avoid circular import
 if TYPE_CHECKING:
@@ -165,6 +184,71 @@ def _preference_widget_targets(
     ]
 
 
+def _intensity_histogram(
+    pixels: np.ndarray,
+    bits: int,
+    n_bins: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Count unsigned integer ``pixels`` into ``n_bins`` bins over ``[0, 2**bits)``.
+
+    Gives the same counts as ``np.histogram(pixels, n_bins, (0, 2**bits))`` for
+    in-range pixels, but maps each pixel to its bin with a bit shift and a
+    single ``np.bincount`` pass instead of per-pixel float comparisons.
+    ``n_bins`` must be a power of two. ``out``, if given, is a flat scratch
+    array of the pixels' size and dtype that receives the shifted pixels.
+    """
+    shift = bits - (n_bins.bit_length() - 1)
+    pixels = pixels.ravel()
+    if shift > 0:
+        pixels = np.right_shift(pixels, shift, out=out)
+    elif shift < 0:
+        pixels = pixels.astype(np.intp) << -shift
+    return np.bincount(pixels, minlength=n_bins)[:n_bins]
+
+
+def _roi_pixel_indices(rois: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Return the flat row-major indices of every pixel inside ``rois``.
+
+    ``rois`` rows are ``(x0, x1, y0, y1)`` and ``shape`` is the frame's
+    ``(height, width)``. ROIs are clipped to the frame like slicing would.
+    """
+    height, width = shape
+    if len(rois) == 0:
+        return np.zeros((0,), dtype=np.intp)
+    return np.concatenate([
+        (np.arange(y0, min(y1, height), dtype=np.intp)[:, None] * width
+         + np.arange(x0, min(x1, width), dtype=np.intp)).ravel()
+        for x0, x1, y0, y1 in np.asarray(rois, dtype=np.intp)
+    ])
+
+
+def _remember_setting(key: str, value: str) -> None:
+    """Store ``value`` under ``key`` unless the shared settings already hold it."""
+    settings = shared_settings()
+    if settings.value(key, None, type=str) != value:
+        settings.setValue(key, value)
+
+
+def _open_dir(caption: str, directory: str) -> str:
+    """Ask the user for a directory with the platform's folder picker.
+
+    ``ShowDirsOnly`` limits the picker to folders. Qt hands
+    ``DontResolveSymlinks`` to the native dialog where the platform has an
+    equivalent (on Windows, folder shortcuts are returned as picked).
+    ``DontUseCustomDirectoryIcons`` only configures Qt's own icon provider, so
+    it avoids slow per-folder icon lookups only when Qt falls back to its
+    widget-based dialog, e.g. on Linux desktops without a platform dialog; the
+    native Windows and macOS pickers ignore it.
+    """
+    options = (
+        QFileDialog.Option.DontUseCustomDirectoryIcons
+        | QFileDialog.Option.DontResolveSymlinks
+        | QFileDialog.Option.ShowDirsOnly
+    )
+    return QFileDialog.getExistingDirectory(None, caption, directory, options)
+
+
 class ControlPanelBase(QWidget):
     def __init__(
         self,
@@ -539,9 +623,8 @@ class MagScopeSettingsPanel(QWidget):
             if key in self._setting_value_labels:
                 self._update_saved_label_for_input(key)
         for key, checkbox in self._setting_checkboxes.items():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(bool(self._current_settings[key]))
-            checkbox.blockSignals(False)
+            with signals_blocked(checkbox):
+                checkbox.setChecked(bool(self._current_settings[key]))
 
     def _apply_setting_from_input(self, key: str) -> None:
         lineedit = self._setting_inputs.get(key)
@@ -606,7 +689,7 @@ class MagScopeSettingsPanel(QWidget):
                 checkbox = QCheckBox()
                 checkbox.setChecked(bool(self._current_settings[key]))
                 checkbox.toggled.connect(  # type: ignore[arg-type]
-                    lambda checked, k=key: self._apply_bool_setting(k, checked)
+                    functools.partial(self._apply_bool_setting, key)
                 )
                 grid.addWidget(checkbox, row, 1)
                 self._setting_checkboxes[key] = checkbox
@@ -622,7 +705,7 @@ class MagScopeSettingsPanel(QWidget):
             lineedit.setFixedWidth(120)
             lineedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
             lineedit.editingFinished.connect(  # type: ignore[arg-type]
-                lambda k=key: self._apply_setting_from_input(k)
+                functools.partial(self._apply_setting_from_input, key)
             )
             lineedit.textChanged.connect(  # type: ignore[arg-type]
                 lambda _text, k=key: self._update_saved_label_for_input(k)
@@ -723,8 +806,13 @@ class AcquisitionPanel(ControlPanelBase):
             AcquisitionMode.VIDEO_ROIS,
             AcquisitionMode.VIDEO_FULL,
         ]
+        # Fill a detached model and attach it once instead of one insert per mode
+        acquisition_mode_model = QStandardItemModel(self.acquisition_mode_combobox)
         for mode in acquisition_modes:
-            self.acquisition_mode_combobox.addItem(mode)
+            item = QStandardItem(str(mode))
+            item.setData(mode, Qt.ItemDataRole.UserRole)
+            acquisition_mode_model.appendRow(item)
+        self.acquisition_mode_combobox.setModel(acquisition_mode_model)
         self.acquisition_mode_combobox.setCurrentText(self.manager._acquisition_mode)
         self.acquisition_mode_combobox.currentIndexChanged.connect(
             self.callback_acquisition_mode)  # type: ignore
@@ -768,37 +856,37 @@ class AcquisitionPanel(ControlPanelBase):
         self.acquisition_dir_textedit.setToolTip(path or '')
         self.acquisition_dir_textedit.setCursorPosition(0)
 
+    @pyqtSlot()
     def callback_acquisition_on(self):
         is_enabled: bool = self.acquisition_on_checkbox.checkbox.isChecked()
         command = SetAcquisitionOnCommand(value=is_enabled)
         self.manager.send_ipc(command)
 
+    @pyqtSlot()
     def callback_acquisition_dir_on(self):
         should_save: bool = self.acquisition_dir_on_checkbox.checkbox.isChecked()
         self.update_save_highlight(should_save)
         command = SetAcquisitionDirOnCommand(value=should_save)
         self.manager.send_ipc(command)
 
+    @pyqtSlot()
     def callback_acquisition_mode(self):
-        selected_mode: AcquisitionMode = self.acquisition_mode_combobox.currentText()
+        selected_mode: AcquisitionMode = self.acquisition_mode_combobox.currentData()
         command = SetAcquisitionModeCommand(mode=selected_mode)
         self.manager.send_ipc(command)
 
+    @pyqtSlot()
     def callback_acquisition_dir(self):
-        settings = QSettings('MagScope', 'MagScope')
-        last_directory = settings.value(
+        last_directory = shared_settings().value(
             'last acquisition_dir',
             os.path.expanduser("~"),
             type=str
         )
-        selected_directory = QFileDialog.getExistingDirectory(
-            None,
-            'Select Folder',
-            last_directory)
+        selected_directory = _open_dir('Select Folder', last_directory)
 
         if selected_directory:
             self.set_acquisition_dir_text(selected_directory)
-            settings.setValue('last acquisition_dir', QVariant(selected_directory))
+            _remember_setting('last acquisition_dir', selected_directory)
         else:
             selected_directory = None
             self.set_acquisition_dir_text(None)
@@ -843,20 +931,18 @@ class AcquisitionPanel(ControlPanelBase):
 
 
 class BeadSelectionPanel(ControlPanelBase):
+    INSTRUCTIONS_TEXT = (
+        '<b>Add a bead:</b> Left-click on the video<br>\n'
+        '<b>Activate a bead:</b> Left-click on the bead ROI<br>\n'
+        '<b>Move a bead:</b> Drag the active bead ROI<br>\n'
+        '<b>Remove a bead:</b> Right-click on the bead'
+    )
 
     def __init__(self, manager: 'UIManager'):
         super().__init__(manager=manager, title='Bead Selection', collapsed_by_default=False)
 
         # Instructions
-        note_text = textwrap.dedent(
-            """
-            <b>Add a bead:</b> Left-click on the video<br>
-            <b>Activate a bead:</b> Left-click on the bead ROI<br>
-            <b>Move a bead:</b> Drag the active bead ROI<br>
-            <b>Remove a bead:</b> Right-click on the bead
-            """
-        ).strip()
-        note = QLabel(note_text)
+        note = QLabel(self.INSTRUCTIONS_TEXT)
         note.setWordWrap(True)
         self.layout().addWidget(note)
 
@@ -923,13 +1009,14 @@ class CameraPanel(ControlPanelBase):
 
         self._last_settings_update: datetime.datetime | None = None
 
-        self.settings = {}
-        for setting_name in self.manager.camera_type.settings:
-            self.settings[setting_name] = LabeledLineEditWithValue(
-                label_text=setting_name,
-                widths=(0, 100, 50),
-                callback=lambda n=setting_name: self.callback_set_camera_setting(n))
-            self.layout().addWidget(self.settings[setting_name])
+        # The panel may sit in a tab or dock that is never opened, so the
+        # setting rows are only built when first shown or when values arrive
+        self.settings: dict[str, LabeledLineEditWithValue] = {}
+        self._settings_built: bool = False
+        self._settings_layout = QVBoxLayout()
+        self._settings_layout.setContentsMargins(0, 0, 0, 0)
+        self._settings_layout.setSpacing(2)
+        self.layout().addLayout(self._settings_layout)
 
         refresh_row = QHBoxLayout()
         self.layout().addLayout(refresh_row)
@@ -944,12 +1031,28 @@ class CameraPanel(ControlPanelBase):
         self.last_update_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         refresh_row.addWidget(self.last_update_label)
 
+    def showEvent(self, event):  # type: ignore[override]
+        self._build_settings()
+        super().showEvent(event)
+
+    def _build_settings(self) -> None:
+        if self._settings_built:
+            return
+        self._settings_built = True
+        for setting_name in self.manager.camera_type.settings:
+            self.settings[setting_name] = LabeledLineEditWithValue(
+                label_text=setting_name,
+                widths=(0, 100, 50),
+                callback=functools.partial(self.callback_set_camera_setting, setting_name))
+            self._settings_layout.addWidget(self.settings[setting_name])
+
+    @pyqtSlot()
     def callback_refresh(self):
-        for name in self.manager.camera_type.settings:
-            command = GetCameraSettingCommand(name=name)
-            self.manager.send_ipc(command)
+        names = tuple(self.manager.camera_type.settings)
+        command = GetCameraSettingsCommand(names=names)
+        self.manager.send_ipc(command)
 
-    def callback_set_camera_setting(self, name):
+    def callback_set_camera_setting(self, name: str):
         setting_value = self.settings[name].lineedit.text()
         if not setting_value:
             return
@@ -959,7 +1062,12 @@ class CameraPanel(ControlPanelBase):
         self.manager.send_ipc(command)
         
     def update_camera_setting(self, name: str, value: str):
-        self.settings[name].value_label.setText(value)
+        self.update_camera_settings({name: value})
+
+    def update_camera_settings(self, values: dict[str, str]):
+        self._build_settings()
+        for name, value in values.items():
+            self.settings[name].value_label.setText(value)
         self._last_settings_update = datetime.datetime.now()
         self.last_update_label.setText(self._format_last_update_text())
 
@@ -976,6 +1084,20 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
 
         self.update_interval: float = 1  # seconds
         self._update_last_time: float = 0
+        # Enabled and expanded; cached so the frame loop can skip us cheaply
+        self._active: bool = False
+        # Flat pixel indices of the bead ROIs and a matching gather buffer,
+        # rebuilt only when the cached ROI array (or frame shape) changes
+        self._roi_source: np.ndarray | None = None
+        self._roi_shape: tuple[int, int] | None = None
+        self._roi_indices = np.zeros((0,), dtype=np.intp)
+        self._roi_pixels: np.ndarray | None = None
+        # Set once the bars are zeroed so repeated clears skip the redraw
+        self._is_cleared: bool = False
+        # The camera is fixed for the session, so its bit depth is read once
+        # and the shifted pixels go to a scratch buffer reused across frames
+        self._bits: int | None = None
+        self._shifted_pixels: np.ndarray | None = None
 
         # ===== First Row ===== #
         controls_row = QHBoxLayout()
@@ -991,7 +1113,7 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
         controls_row.addWidget(self.enable_checkbox)
 
         # Keep enabled state synced with collapse/expand so highlighting matches behavior
-        self.groupbox.toggle_button.toggled.connect(self._groupbox_toggled)
+        self.groupbox.collapsed_changed.connect(self._groupbox_collapsed_changed)
 
         self.only_beads_checkbox = LabeledCheckbox(
             label_text='Only ROIs', default=False)
@@ -1000,6 +1122,8 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
 
         # ===== Plot ===== #
         self.n_bins = 256
+        self._log_counts = np.zeros(self.n_bins, dtype=np.float64)
+        self._zero_counts = np.zeros(self.n_bins, dtype=np.float64)
         self.figure = Figure(dpi=100, facecolor=PANEL_BACKGROUND_COLOR, constrained_layout=True)
         self.figure.set_constrained_layout_pads(w_pad=0.02, h_pad=0.02, hspace=0.0, wspace=0.0)
         self.canvas = ResponsivePlotCanvas(
@@ -1010,10 +1134,13 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
         )
         self.axes = self.figure.subplots(nrows=1, ncols=1)
 
-        _, _, self.bars = self.axes.hist(
-            [],
-            bins=self.n_bins,
-            edgecolor=None,
+        # One filled step outline instead of a Rectangle patch per bin, so
+        # each update rebuilds a single path rather than 256 artists
+        self.bars = self.axes.stairs(
+            self._zero_counts,
+            np.linspace(0, 1, self.n_bins + 1),
+            fill=True,
+            linewidth=0,
             facecolor=get_accent_color(),
         )
 
@@ -1037,20 +1164,32 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
         self.layout().addWidget(self.canvas)
         self._init_matplotlib_cleanup()
 
+    @property
+    def is_active(self) -> bool:
+        """Whether the histogram is enabled and expanded, i.e. wants frames."""
+        return self._active
+
+    @pyqtSlot(bool)
     def enabled_callback(self, enabled: bool) -> None:
         effective_enabled = enabled and not self.groupbox.collapsed
         self._apply_enabled_state(effective_enabled)
 
-    def _groupbox_toggled(self, expanded: bool) -> None:
-        enabled = expanded and self.enable_checkbox.checkbox.isChecked()
+    @pyqtSlot(bool)
+    def _groupbox_collapsed_changed(self, collapsed: bool) -> None:
+        enabled = not collapsed and self.enable_checkbox.checkbox.isChecked()
         self._apply_enabled_state(enabled)
 
     def _apply_enabled_state(self, enabled: bool) -> None:
+        self._active = enabled
         self.set_highlighted(enabled)
         self.clear()
 
-    def update_plot(self, data):
-        if not self.enable_checkbox.checkbox.isChecked() or self.groupbox.collapsed:
+    def update_plot(self, image: np.ndarray):
+        """Plot the histogram of a ``(height, width)`` frame.
+
+        ``image`` may be a view into the video buffer; it is only read here.
+        """
+        if not self._active:
             return
 
         current_time = time.time()
@@ -1058,43 +1197,89 @@ class HistogramPanel(MatplotlibCleanupMixin, ControlPanelBase):
             return
         self._update_last_time = current_time
 
-        image_dtype = self.manager.camera_type.dtype
-        max_intensity = 2 ** self.manager.camera_type.bits
-        image_shape = self.manager.video_buffer.image_shape
-        image = np.frombuffer(data, image_dtype).reshape(image_shape)
+        if self._bits is None:
+            self._bits = self.manager.camera_type.bits
 
         if self.only_beads_checkbox.checkbox.isChecked():
             _, bead_rois = self.manager.get_cached_bead_rois()
             if len(bead_rois) > 0:
-                image = crop_stack_to_rois(
-                    np.swapaxes(image, 0, 1)[:, :, None], bead_rois)
+                image = self._gather_roi_pixels(image, bead_rois)
             else:
                 self.clear()
                 return
 
-        counts, _ = np.histogram(image, bins=256, range=(0, max_intensity))
+        counts = _intensity_histogram(
+            image, self._bits, self.n_bins, out=self._shift_buffer(image))
         # fast safe log to prevent log(0)
-        counts = np.log(counts + 1)
+        counts = np.log1p(counts, out=self._log_counts)
 
-        for count, rect in zip(counts, self.bars.patches):
-            rect.set_height(count)
-            rect.set_facecolor(get_accent_color())
+        self.bars.set_data(counts)
+        self.bars.set_facecolor(get_accent_color())
 
         max_count = counts.max() if len(counts) > 0 else 1
         self.axes.set_ylim(0, max_count * 1.1)
 
         self.canvas.draw()
+        self._is_cleared = False
+
+    def _shift_buffer(self, pixels: np.ndarray) -> np.ndarray:
+        buffer = self._shifted_pixels
+        if buffer is None or buffer.size != pixels.size or buffer.dtype != pixels.dtype:
+            buffer = self._shifted_pixels = np.empty(pixels.size, dtype=pixels.dtype)
+        return buffer
+
+    def _gather_roi_pixels(self, image: np.ndarray, bead_rois: np.ndarray) -> np.ndarray:
+        """Copy the pixels inside ``bead_rois`` out of a (Y, X) frame.
+
+        The flat ROI indices are cached, so each frame is a single ``np.take``
+        into a reused buffer rather than a Python loop over the ROIs. The
+        manager replaces its cached ROI array whenever beads change, so an
+        identity check is enough to detect stale indices.
+        """
+        if (
+            bead_rois is not self._roi_source
+            or image.shape != self._roi_shape
+            or self._roi_pixels.dtype != image.dtype
+        ):
+            self._roi_source = bead_rois
+            self._roi_shape = image.shape
+            self._roi_indices = _roi_pixel_indices(bead_rois, image.shape)
+            self._roi_pixels = np.empty(self._roi_indices.shape, dtype=image.dtype)
+        return np.take(image.ravel(), self._roi_indices, out=self._roi_pixels)
 
     def clear(self):
-        for rect in self.bars.patches:
-            rect.set_height(0)
+        if self._is_cleared:
+            return
+        self.bars.set_data(self._zero_counts)
         self.canvas.draw()
+        self._is_cleared = True
 
 
 class PlotSettingsPanel(ControlPanelBase):
+    # Quiet period after the last keystroke before limits reach the plot worker
+    EDIT_DEBOUNCE_MS = 100
+
     def __init__(self, manager: 'UIManager'):
         super().__init__(manager=manager, title='Plot Settings', collapsed_by_default=True)
 
+        # Each keystroke in a limit box would otherwise send a new payload to
+        # the plot worker; coalesce a typing burst into one update instead
+        self._limits_debounce = QTimer(self)
+        self._limits_debounce.setSingleShot(True)
+        self._limits_debounce.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._limits_debounce.timeout.connect(lambda: self.limits_callback(None))  # type: ignore
+        self._relative_window_debounce = QTimer(self)
+        self._relative_window_debounce.setSingleShot(True)
+        self._relative_window_debounce.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._relative_window_debounce.timeout.connect(  # type: ignore
+            lambda: self.relative_time_window_callback(None))
+
+        # Last values sent to the plot worker; edits that parse to the same
+        # values (e.g. '1' -> '1.0') are not sent again
+        self._sent_limits: dict[str, tuple[float | None, float | None]] | None = None
+        self._sent_relative_window: float | None = None
+        self._relative_window_sent = False
+
         # Selected Bead
         self.selected_bead = LabeledLineEdit(
             label_text='Selected Bead (red)',
@@ -1131,11 +1316,7 @@ class PlotSettingsPanel(ControlPanelBase):
         for _, plot in enumerate(self.manager.plot_worker.plots):
             row_index += 1
             ylabel = plot.ylabel
-            self.limits[ylabel] = (QLineEdit(), QLineEdit())
-            self.limits[ylabel][0].textChanged.connect(self.limits_callback)
-            self.limits[ylabel][1].textChanged.connect(self.limits_callback)
-            self.limits[ylabel][0].setPlaceholderText('auto')
-            self.limits[ylabel][1].setPlaceholderText('auto')
+            self.limits[ylabel] = (self._new_limit_input(), self._new_limit_input())
             self.grid_layout.addWidget(QLabel(ylabel), row_index, 0)
             self.grid_layout.addWidget(self.limits[ylabel][0], row_index, 1)
             self.grid_layout.addWidget(self.limits[ylabel][1], row_index, 2)
@@ -1160,11 +1341,7 @@ class PlotSettingsPanel(ControlPanelBase):
         time_absolute_layout.setSpacing(4)
         time_absolute_widget.setLayout(time_absolute_layout)
 
-        self.time_limits_absolute = (QLineEdit(), QLineEdit())
-        self.time_limits_absolute[0].setPlaceholderText('auto')
-        self.time_limits_absolute[1].setPlaceholderText('auto')
-        self.time_limits_absolute[0].textChanged.connect(self.limits_callback)
-        self.time_limits_absolute[1].textChanged.connect(self.limits_callback)
+        self.time_limits_absolute = (self._new_limit_input(), self._new_limit_input())
         time_absolute_layout.addWidget(self.time_limits_absolute[0])
         time_absolute_layout.addWidget(self.time_limits_absolute[1])
 
@@ -1176,7 +1353,7 @@ class PlotSettingsPanel(ControlPanelBase):
         time_relative_widget.setLayout(time_relative_layout)
 
         self.time_relative_window = QLineEdit('00:05:00')
-        self.time_relative_window.textChanged.connect(self.relative_time_window_callback)
+        self.time_relative_window.textChanged.connect(self._schedule_relative_window_update)
         time_relative_layout.addWidget(self.time_relative_window)
 
         self.time_inputs_stack = QStackedLayout()
@@ -1364,6 +1541,18 @@ class PlotSettingsPanel(ControlPanelBase):
         else:
             self.limits_callback(None)
 
+    def _new_limit_input(self) -> QLineEdit:
+        lineedit = QLineEdit()
+        lineedit.setPlaceholderText('auto')
+        lineedit.textChanged.connect(self._schedule_limits_update)
+        return lineedit
+
+    def _schedule_limits_update(self, _text: str) -> None:
+        self._limits_debounce.start()
+
+    def _schedule_relative_window_update(self, _text: str) -> None:
+        self._relative_window_debounce.start()
+
     def relative_time_window_callback(self, _value):
         text = self.time_relative_window.text()
         window_seconds: float | None
@@ -1383,6 +1572,10 @@ class PlotSettingsPanel(ControlPanelBase):
                 window_seconds = None
         except (TypeError, ValueError):
             window_seconds = None
+        if self._relative_window_sent and window_seconds == self._sent_relative_window:
+            return
+        self._sent_relative_window = window_seconds
+        self._relative_window_sent = True
         self.manager.plot_worker.relative_window_signal.emit(window_seconds)
 
     def limits_callback(self, _):
@@ -1411,6 +1604,9 @@ class PlotSettingsPanel(ControlPanelBase):
                         parsed_value = None
                 parsed_limits.append(parsed_value)
             limits_payload[axis_label] = tuple(parsed_limits)
+        if limits_payload == self._sent_limits:
+            return
+        self._sent_limits = limits_payload
         self.manager.plot_worker.limits_signal.emit(limits_payload)
 
     def beads_in_view_on_callback(self):
@@ -1529,7 +1725,7 @@ class AllanDeviationPanel(MatplotlibCleanupMixin, ControlPanelBase):
         self.taus_mode.currentTextChanged.connect(lambda _value: self._persist_controls())
 
     def _settings(self) -> QSettings:
-        return QSettings('MagScope', 'MagScope')
+        return shared_settings()
 
     def _setting_key(self, name: str) -> str:
         return f'{self._SETTINGS_GROUP}/{name}'
@@ -1697,9 +1893,10 @@ class AllanDeviationPanel(MatplotlibCleanupMixin, ControlPanelBase):
     ) -> tuple[np.ndarray, np.ndarray]:
         if timestamps.size == 0:
             return timestamps, values
-        cutoff = float(np.max(timestamps)) - float(window_seconds)
-        keep = timestamps >= cutoff
-        return timestamps[keep], values[keep]
+        # Timestamps arrive sorted, so the window is a slice off the end
+        cutoff = float(timestamps[-1]) - float(window_seconds)
+        start = np.searchsorted(timestamps, cutoff, side='left')
+        return timestamps[start:], values[start:]
 
     @staticmethod
     def _extract_axis_series(
@@ -1818,39 +2015,41 @@ class ProfilePanel(MatplotlibCleanupMixin, ControlPanelBase):
         if not self.enable.checkbox.isChecked() or self.groupbox.collapsed:
             return
 
-        selected_bead = self.manager.selected_bead
+        # Called every main-loop tick, so resolve the manager once
+        manager = self.manager
+        selected_bead = manager.selected_bead
         if selected_bead == -1:
             self.selected_bead_label.setText('')
         else:
             self.selected_bead_label.setText(str(selected_bead))
 
-        if not self.manager.shared_values.live_profile_enabled.value:
+        if not manager.shared_values.live_profile_enabled.value:
             self.clear()
             return
 
-        buffer_data = self.manager.live_profile_buffer.peak_unsorted()
-        latest_entry = buffer_data[0]
-        profile_length = latest_entry[2] if np.isfinite(latest_entry[2]) else 0
+        latest_entry = manager.live_profile_buffer.peak_unsorted()[0]
+        profile_length = int(latest_entry[2]) if np.isfinite(latest_entry[2]) else 0
         bead_id = int(latest_entry[1]) if np.isfinite(latest_entry[1]) else -1
 
         if selected_bead != bead_id or profile_length <= 0:
             self.clear()
             return
 
-        self.profile_length_label.setText(str(int(profile_length)))
+        self.profile_length_label.setText(str(profile_length))
 
-        cleaned_profile = latest_entry[3:3 + int(profile_length)]
-        radial_distances = np.arange(profile_length)
-        radial_distances = radial_distances[np.isfinite(cleaned_profile)]
-        cleaned_profile = cleaned_profile[np.isfinite(cleaned_profile)]
+        profile = latest_entry[3:3 + profile_length]
+        finite = np.isfinite(profile)
+        radial_distances = np.flatnonzero(finite)
+        cleaned_profile = profile[finite]
 
-        self.line.set_xdata(radial_distances)
-        self.line.set_ydata(cleaned_profile)
-        self.line.set_color(get_accent_color())
+        line = self.line
+        line.set_xdata(radial_distances)
+        line.set_ydata(cleaned_profile)
+        line.set_color(get_accent_color())
 
-        if len(cleaned_profile) > 0:
-            self.axes.set_xlim(0, max(radial_distances))
-            self.axes.set_ylim(0, max(cleaned_profile))
+        if cleaned_profile.size > 0:
+            self.axes.set_xlim(0, radial_distances[-1])
+            self.axes.set_ylim(0, cleaned_profile.max())
 
         self.canvas.draw()
 
@@ -2092,9 +2291,8 @@ class TrackingOptionsPanel(ControlPanelBase):
         self.fft_rmax.value_label.setText(str(fft_settings['rmax']))
         self.fft_gaus_factor.value_label.setText(str(fft_settings['gaus_factor']))
 
-        self.use_fft.checkbox.blockSignals(True)
-        self.use_fft.checkbox.setChecked(bool(self._current_options['use fft_profile']))
-        self.use_fft.checkbox.blockSignals(False)
+        with signals_blocked(self.use_fft.checkbox):
+            self.use_fft.checkbox.setChecked(bool(self._current_options['use fft_profile']))
 
     def _sync_fft_enabled_state(self) -> None:
         use_fft = self.use_fft.checkbox.isChecked()
@@ -2117,14 +2315,12 @@ class TrackingOptionsPanel(ControlPanelBase):
         self._current_options = tracking_options_from_mapping(options)
         self._updating_fields = True
         try:
-            self.background_combo.blockSignals(True)
-            self.background_combo.setCurrentText(self._current_options['center_of_mass']['background'])
-            self.background_combo.blockSignals(False)
+            with signals_blocked(self.background_combo):
+                self.background_combo.setCurrentText(self._current_options['center_of_mass']['background'])
             self._update_value_labels()
             self._populate_inputs_from_options()
             self._sync_fft_enabled_state()
         finally:
-            self.background_combo.blockSignals(False)
             self._updating_fields = False
         save_tracking_options_to_qsettings(self._current_options)
         self.manager.send_ipc(UpdateTrackingOptionsCommand(value=copy.deepcopy(self._current_options)))
@@ -2964,15 +3160,14 @@ class ScriptPanel(ControlPanelBase):
         self.pause_button.clicked.connect(self.callback_pause)  # type: ignore
 
         # Filepath
-        self.filepath_textedit = QTextEdit(self.NO_SCRIPT_SELECTED_TEXT)
-        self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.filepath_textedit.setTextInteractionFlags(
+        self.filepath_label = QLabel(self.NO_SCRIPT_SELECTED_TEXT)
+        self.filepath_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.filepath_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.filepath_label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.filepath_textedit.setFixedHeight(40)
-        self.filepath_textedit.setWordWrapMode(QTextOption.WrapMode.NoWrap)
-        self.filepath_textedit.setVerticalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.layout().addWidget(self.filepath_textedit)
+        self.filepath_label.setFixedHeight(40)
+        self.filepath_label.setWordWrap(False)
+        self.layout().addWidget(self.filepath_label)
 
         self.update_status(ScriptStatus.EMPTY)
         self.update_step(None, 0, None)
@@ -2988,10 +3183,7 @@ class ScriptPanel(ControlPanelBase):
         self.pause_button.setEnabled(status in (ScriptStatus.RUNNING, ScriptStatus.PAUSED))
 
         if status == ScriptStatus.EMPTY:
-            self.filepath_textedit.setText(self.NO_SCRIPT_SELECTED_TEXT)
-            self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        elif status == ScriptStatus.ERROR:
-            self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.filepath_label.setText(self.NO_SCRIPT_SELECTED_TEXT)
 
     def update_step(self, current_step: int | None, total_steps: int, description: str | None):
         total_steps = max(total_steps, 0)
@@ -3008,32 +3200,29 @@ class ScriptPanel(ControlPanelBase):
             self.step_description_label.clear()
             self.step_description_label.setVisible(False)
 
+    @pyqtSlot()
     def callback_load(self):
-        settings = QSettings('MagScope', 'MagScope')
-        last_script_path = settings.value(
+        last_script_path = shared_settings().value(
             'last script filepath',
             os.path.expanduser("~"),
             type=str
         )
-        script_path, _ = QFileDialog.getOpenFileName(None,
-                                                     'Select Script File',
-                                                     last_script_path,
-                                                     'Script (*.py)')
+        script_path = open_file('Select Script File', last_script_path, 'Script (*.py)')
+        if not script_path:  # user selected cancel, keep the current script
+            return
 
         command = LoadScriptCommand(path=script_path)
         self.manager.send_ipc(command)
 
-        if not script_path:  # user selected cancel
-            script_path = self.NO_SCRIPT_SELECTED_TEXT
-        else:
-            settings.setValue('last script filepath', QVariant(script_path))
-        self.filepath_textedit.setText(script_path)
-        self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        _remember_setting('last script filepath', script_path)
+        self.filepath_label.setText(script_path)
 
+    @pyqtSlot()
     def callback_start(self):
         command = StartScriptCommand()
         self.manager.send_ipc(command)
 
+    @pyqtSlot()
     def callback_pause(self):
         if self.pause_button.text() == 'Pause':
             command = PauseScriptCommand()
@@ -3049,10 +3238,26 @@ class StatusPanel(ControlPanelBase):
 
         self.layout().setSpacing(0)
         self.dot_count = 0
+        self._display_rate_text: str | None = None
 
         # GUI display rate
         self.display_rate_status = QLabel()
         self.layout().addWidget(self.display_rate_status)
+        # The trailing dots only show liveness, so animate them at a fixed
+        # rate instead of repainting the label on every main-loop tick
+        self._dot_timer = QTimer(self)
+        self._dot_timer.setInterval(250)
+        self._dot_timer.timeout.connect(self._tick_dots)  # type: ignore
+        self._dot_timer.start()
+
+        # Status text arrives every main-loop tick; keep only the latest value
+        # per label (and for the buffer bar) and paint at most 10 times a second
+        self._pending_status: dict[QLabel, str] = {}
+        self._pending_buffer_percent: int | None = None
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(100)
+        self._status_flush_timer.timeout.connect(self._flush_status)  # type: ignore
 
         # Video Processors
         self.video_processors_status = QLabel()
@@ -3073,20 +3278,43 @@ class StatusPanel(ControlPanelBase):
         self.layout().addWidget(self.video_buffer_purge_label)
 
     def update_display_rate(self, text):
+        if text == self._display_rate_text:
+            return
+        self._display_rate_text = text
+        self._render_display_rate()
+
+    @pyqtSlot()
+    def _tick_dots(self):
+        if self._display_rate_text is None:
+            return
         self.dot_count = (self.dot_count + 1) % 4
+        self._render_display_rate()
+
+    def _render_display_rate(self):
         dot_text = '.' * self.dot_count
-        self.display_rate_status.setText(f'Display Rate: {text} {dot_text}')
+        self.display_rate_status.setText(f'Display Rate: {self._display_rate_text} {dot_text}')
 
     def update_video_processors_status(self, status_text: str):
-        self.video_processors_status.setText(f'Video Processors: {status_text}')
-
-    def update_video_buffer_status(self, status_text: str):
-        self.video_buffer_status.setText(f'Video Buffer: {status_text}')
-        try:
-            percent_full = int(status_text.split('%')[0])
-        except (ValueError, IndexError):
-            percent_full = 0
-        self.video_buffer_status_bar.setValue(percent_full)
+        self._queue_status(self.video_processors_status, f'Video Processors: {status_text}')
+
+    def update_video_buffer_status(self, percent_full: int, status_text: str):
+        self._pending_buffer_percent = percent_full
+        self._queue_status(self.video_buffer_status, f'Video Buffer: {status_text}')
+
+    def _queue_status(self, label: QLabel, text: str) -> None:
+        self._pending_status[label] = text
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_status(self) -> None:
+        pending, self._pending_status = self._pending_status, {}
+        for label, text in pending.items():
+            if label.text() != text:
+                label.setText(text)
+        percent, self._pending_buffer_percent = self._pending_buffer_percent, None
+        if percent is not None and percent != self.video_buffer_status_bar.value():
+            self.video_buffer_status_bar.setValue(percent)
 
     def _update_video_buffer_size_label(self) -> None:
         video_buffer = getattr(self.manager, 'video_buffer', None)
@@ -3447,9 +3675,8 @@ class XYLockPanel(ControlPanelBase):
         self.manager.send_ipc(command)
 
     def update_enabled(self, value: bool):
-        self.enabled.checkbox.blockSignals(True)
-        self.enabled.checkbox.setChecked(value)
-        self.enabled.checkbox.blockSignals(False)
+        with signals_blocked(self.enabled.checkbox):
+            self.enabled.checkbox.setChecked(value)
         self.set_highlighted(value)
         self._update_badge()
 
@@ -3617,20 +3844,19 @@ class ZLockPanel(ControlPanelBase):
         self._refresh_bead_combo()
 
     def _refresh_bead_combo(self) -> None:
-        self._bead_combo.blockSignals(True)
-        current_text = self._bead_combo.currentText()
-        try:
-            bead_rois = self.manager._bead_rois
-        except (AttributeError, TypeError):
-            bead_rois = {}
-        self._bead_combo.clear()
-        for bead_id in sorted(bead_rois.keys()):
-            self._bead_combo.addItem(str(bead_id))
-        if current_text:
-            idx = self._bead_combo.findText(current_text)
-            if idx >= 0:
-                self._bead_combo.setCurrentIndex(idx)
-        self._bead_combo.blockSignals(False)
+        with signals_blocked(self._bead_combo):
+            current_text = self._bead_combo.currentText()
+            try:
+                bead_rois = self.manager._bead_rois
+            except (AttributeError, TypeError):
+                bead_rois = {}
+            self._bead_combo.clear()
+            for bead_id in sorted(bead_rois.keys()):
+                self._bead_combo.addItem(str(bead_id))
+            if current_text:
+                idx = self._bead_combo.findText(current_text)
+                if idx >= 0:
+                    self._bead_combo.setCurrentIndex(idx)
 
     def _bead_combo_callback(self, text: str) -> None:
         try:
@@ -3718,9 +3944,8 @@ class ZLockPanel(ControlPanelBase):
         self.manager.send_ipc(command)
 
     def update_enabled(self, value: bool):
-        self.enabled.checkbox.blockSignals(True)
-        self.enabled.checkbox.setChecked(value)
-        self.enabled.checkbox.blockSignals(False)
+        with signals_blocked(self.enabled.checkbox):
+            self.enabled.checkbox.setChecked(value)
         self.set_highlighted(value)
         self._update_badge()
 
@@ -3730,7 +3955,6 @@ class ZLockPanel(ControlPanelBase):
         self.bead.value_label.setCurrentText(str(value))
 
     def _has_focus_motor(self) -> bool:
-        from magscope.hardware import FocusMotorBase
         try:
             hardware_types = self.manager.hardware_types
         except (AttributeError, TypeError):
@@ -3829,25 +4053,10 @@ class ZLUTGenerationPanel(ControlPanelBase):
         ]
 
     def generate_callback(self):
-        # Start
-        start_text = self.start_input.lineedit.text()
-        try:
-            start_nm = float(start_text)
-        except ValueError:
-            return
-
-        # Step
-        step_text = self.step_input.lineedit.text()
-        try:
-            step_nm = float(step_text)
-        except ValueError:
-            return
-
-        # Stop
-        stop_text = self.stop_input.lineedit.text()
-        try:
-            stop_nm = float(stop_text)
-        except ValueError:
+        start_nm = self.start_input.value()
+        step_nm = self.step_input.value()
+        stop_nm = self.stop_input.value()
+        if start_nm is None or step_nm is None or stop_nm is None:
             return
 
         measurements_text = self.measurements_input.lineedit.text()
@@ -3935,10 +4144,12 @@ class ZLUTGenerationSetupDialog(QDialog):
         return self._values
 
     def _accept_if_valid(self) -> None:
+        start_nm = self.start_input.value()
+        step_nm = self.step_input.value()
+        stop_nm = self.stop_input.value()
         try:
-            start_nm = float(self.start_input.lineedit.text())
-            step_nm = float(self.step_input.lineedit.text())
-            stop_nm = float(self.stop_input.lineedit.text())
+            if start_nm is None or step_nm is None or stop_nm is None:
+                raise ValueError
             profiles_per_bead = int(self.measurements_input.lineedit.text())
         except ValueError:
             QMessageBox.warning(self, 'Invalid Z-LUT settings', 'Enter numeric Z-LUT settings.')
@@ -4101,6 +4312,8 @@ class ZLUTSweepPreviewWidget(MatplotlibCleanupMixin, QWidget):
 
 
 class ZLUTGenerationDialog(QDialog):
+    PROGRESS_FLUSH_MS = 33
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self.setWindowTitle('Z-LUT Generation')
@@ -4132,6 +4345,14 @@ class ZLUTGenerationDialog(QDialog):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
+        # Progress arrives once per sweep step; coalesce bursts so the bar and
+        # label repaint at most ~30 times per second with the latest values.
+        self._pending_progress: tuple[int, int, str] | None = None
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(self.PROGRESS_FLUSH_MS)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+
         self.preview_widget = ZLUTSweepPreviewWidget(self)
         layout.addWidget(self.preview_widget, 1)
 
@@ -4210,13 +4431,23 @@ class ZLUTGenerationDialog(QDialog):
         self._running = True
         self._startup_pending = True
         self._evaluation_active = False
-        self.status_label.setText('Preparing Z-LUT generation...')
-        self.detail_label.setText('Submitting the sweep request and waiting for the first status update.')
-        self.cancel_button.setVisible(False)
-        self.cancel_button.setEnabled(False)
-        self.cancel_button.setText('Cancel')
-        self.close_button.setEnabled(False)
-        self.close_button.setText('Close')
+        with updates_suspended(self):
+            self.status_label.setText('Preparing Z-LUT generation...')
+            self.detail_label.setText('Submitting the sweep request and waiting for the first status update.')
+            self.cancel_button.setVisible(False)
+            self.cancel_button.setEnabled(False)
+            self.cancel_button.setText('Cancel')
+            self.close_button.setEnabled(False)
+            self.close_button.setText('Close')
+            self._reset_progress()
+
+    def _reset_progress(self) -> None:
+        # The dialog is reused across runs; drop the previous run's progress
+        self._progress_flush_timer.stop()
+        self._pending_progress = None
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText('0 / 0 steps')
 
     def _handle_bead_selection_changed(self, index: int) -> None:
         if index < 0:
@@ -4240,17 +4471,18 @@ class ZLUTGenerationDialog(QDialog):
         self._startup_pending = False
         self._running = running
         self._evaluation_active = phase == 'evaluating'
-        self.status_label.setText(status)
-        self.detail_label.setText(detail or '')
-        self.cancel_button.setVisible(running or can_cancel)
-        self.cancel_button.setEnabled(can_cancel)
-        self.cancel_button.setText('Cancel')
-        save_enabled = self._evaluation_active and self._selected_bead_id is not None
-        self.save_button.setEnabled(save_enabled)
-        self.save_and_load_button.setEnabled(save_enabled)
-        self.bead_selector.setEnabled(self.bead_selector.count() > 0)
-        self.close_button.setEnabled(not running)
-        self.close_button.setText('Cancel' if self._evaluation_active else 'Close')
+        with updates_suspended(self):
+            self.status_label.setText(status)
+            self.detail_label.setText(detail or '')
+            self.cancel_button.setVisible(running or can_cancel)
+            self.cancel_button.setEnabled(can_cancel)
+            self.cancel_button.setText('Cancel')
+            save_enabled = self._evaluation_active and self._selected_bead_id is not None
+            self.save_button.setEnabled(save_enabled)
+            self.save_and_load_button.setEnabled(save_enabled)
+            self.bead_selector.setEnabled(self.bead_selector.count() > 0)
+            self.close_button.setEnabled(not running)
+            self.close_button.setText('Cancel' if self._evaluation_active else 'Close')
         if self._close_when_canceled and not running and phase == 'idle':
             self._close_when_canceled = False
             self.close()
@@ -4265,32 +4497,45 @@ class ZLUTGenerationDialog(QDialog):
     ) -> None:
         progress_total = max(total_steps, 1)
         progress_value = min(max(current_step, 0), progress_total)
-        self.progress_bar.setRange(0, progress_total)
-        self.progress_bar.setValue(progress_value)
 
         progress_text = f'{current_step} / {total_steps} steps'
         if capture_capacity > 0:
             progress_text += f' | {capture_count} / {capture_capacity} captures'
         if motor_z_value is not None:
             progress_text += f' | Z = {motor_z_value:.1f} nm'
-        self.progress_label.setText(progress_text)
+
+        self._pending_progress = (progress_total, progress_value, progress_text)
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start()
+
+    def _flush_progress(self) -> None:
+        self._progress_flush_timer.stop()
+        if self._pending_progress is None:
+            return
+        progress_total, progress_value, progress_text = self._pending_progress
+        self._pending_progress = None
+        if self.progress_bar.maximum() != progress_total:
+            self.progress_bar.setRange(0, progress_total)
+        if self.progress_bar.value() != progress_value:
+            self.progress_bar.setValue(progress_value)
+        if self.progress_label.text() != progress_text:
+            self.progress_label.setText(progress_text)
 
     def update_evaluation(self, *, active: bool, bead_ids: list[int], selected_bead_id: int | None) -> None:
         self._evaluation_active = active
-        self.bead_selector.blockSignals(True)
-        self.bead_selector.clear()
-        for bead_id in bead_ids:
-            self.bead_selector.addItem(str(bead_id), bead_id)
-        if selected_bead_id is not None:
-            index = self.bead_selector.findData(selected_bead_id)
-            if index >= 0:
-                self.bead_selector.setCurrentIndex(index)
-                self._selected_bead_id = int(selected_bead_id)
+        with signals_blocked(self.bead_selector):
+            self.bead_selector.clear()
+            for bead_id in bead_ids:
+                self.bead_selector.addItem(str(bead_id), bead_id)
+            if selected_bead_id is not None:
+                index = self.bead_selector.findData(selected_bead_id)
+                if index >= 0:
+                    self.bead_selector.setCurrentIndex(index)
+                    self._selected_bead_id = int(selected_bead_id)
+                else:
+                    self._selected_bead_id = None
             else:
                 self._selected_bead_id = None
-        else:
-            self._selected_bead_id = None
-        self.bead_selector.blockSignals(False)
         self.bead_selector.setEnabled(self.bead_selector.count() > 0)
         save_enabled = active and self._selected_bead_id is not None
         self.save_button.setEnabled(save_enabled)
@@ -4317,6 +4562,35 @@ class ZLUTGenerationDialog(QDialog):
         super().closeEvent(event)
 
 
+def _load_zlut_preview(filepath: str) -> np.ndarray:
+    zlut_array = np.loadtxt(filepath)
+    if zlut_array.ndim != 2 or zlut_array.shape[0] < 2 or zlut_array.shape[1] < 2:
+        raise ValueError('Z-LUT must be a 2D array with z references and profile rows.')
+    return zlut_array
+
+
+class _ZLUTPreviewLoader(QObject):
+    """Carries a background Z-LUT preview load result back to the GUI thread."""
+
+    # (request id, loaded array or the exception raised while loading)
+    finished = pyqtSignal(int, object)
+
+
+class _ZLUTPreviewRunnable(QRunnable):
+    def __init__(self, filepath: str, request_id: int, loader: _ZLUTPreviewLoader):
+        super().__init__()
+        self._filepath = filepath
+        self._request_id = request_id
+        self._loader = loader
+
+    def run(self) -> None:
+        try:
+            result = _load_zlut_preview(self._filepath)
+        except Exception as exc:
+            result = exc
+        self._loader.finished.emit(self._request_id, result)
+
+
 class CurrentZLUTDialog(MatplotlibCleanupMixin, QDialog):
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
@@ -4324,6 +4598,12 @@ class CurrentZLUTDialog(MatplotlibCleanupMixin, QDialog):
         self.resize(720, 560)
         layout = QVBoxLayout(self)
 
+        # Z-LUT files can be large or on slow shares, so previews load on the
+        # thread pool; only the newest request is shown
+        self._preview_request_id = 0
+        self._preview_loader = _ZLUTPreviewLoader()
+        self._preview_loader.finished.connect(self._preview_loaded)
+
         self.preview_status_label = QLabel('No Z-LUT loaded')
         self.preview_status_label.setWordWrap(True)
         layout.addWidget(self.preview_status_label)
@@ -4403,18 +4683,24 @@ class CurrentZLUTDialog(MatplotlibCleanupMixin, QDialog):
         self.canvas.draw()
 
     def _update_preview(self, filepath: str | None) -> None:
+        self._preview_request_id += 1
         if not filepath:
             self._clear_preview('No Z-LUT loaded')
             return
-        try:
-            zlut_array = np.loadtxt(filepath)
-            if zlut_array.ndim != 2 or zlut_array.shape[0] < 2 or zlut_array.shape[1] < 2:
-                raise ValueError('Z-LUT must be a 2D array with z references and profile rows.')
-        except Exception as exc:
-            reason = str(exc).strip() or repr(exc)
+        self.preview_status_label.setText('Loading Z-LUT preview...')
+        runnable = _ZLUTPreviewRunnable(filepath, self._preview_request_id, self._preview_loader)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _preview_loaded(self, request_id: int, result: np.ndarray | Exception) -> None:
+        if request_id != self._preview_request_id or self._matplotlib_disposed:
+            return
+        if isinstance(result, Exception):
+            reason = str(result).strip() or repr(result)
             self._clear_preview(f'Could not load Z-LUT preview: {reason}')
             return
+        self._show_preview(result)
 
+    def _show_preview(self, zlut_array: np.ndarray) -> None:
         z_references = np.asarray(zlut_array[0, :], dtype=np.float64)
         profiles = np.asarray(zlut_array[1:, :], dtype=np.float64)
         finite_z_references = z_references[np.isfinite(z_references)]
@@ -4479,15 +4765,14 @@ class ZLUTPanel(ControlPanelBase):
         controls_row.addWidget(self.clear_button)
 
         # Current filepath display
-        self.filepath_textedit = QTextEdit(self.NO_ZLUT_SELECTED_TEXT)
-        self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.filepath_textedit.setTextInteractionFlags(
+        self.filepath_label = QLabel(self.NO_ZLUT_SELECTED_TEXT)
+        self.filepath_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.filepath_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.filepath_label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.filepath_textedit.setFixedHeight(40)
-        self.filepath_textedit.setWordWrapMode(QTextOption.WrapMode.NoWrap)
-        self.filepath_textedit.setVerticalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.layout().addWidget(self.filepath_textedit)
+        self.filepath_label.setFixedHeight(40)
+        self.filepath_label.setWordWrap(False)
+        self.layout().addWidget(self.filepath_label)
 
         # Metadata
         self._metadata_layout = QVBoxLayout()
@@ -4515,24 +4800,19 @@ class ZLUTPanel(ControlPanelBase):
         return value
 
     def _select_zlut_file(self):
-        settings = QSettings('MagScope', 'MagScope')
-        last_value = settings.value(
+        last_value = shared_settings().value(
             'last zlut directory',
             os.path.expanduser("~"),
             type=str
         )
-        path, _ = QFileDialog.getOpenFileName(None,
-                                              'Select Z-LUT File',
-                                              last_value,
-                                              'Text Files (*.txt)')
+        path = open_file('Select Z-LUT File', last_value, 'Text Files (*.txt)')
         if not path:
             return
 
         directory = os.path.dirname(path) or last_value
-        settings.setValue('last zlut directory', QVariant(directory))
+        _remember_setting('last zlut directory', directory)
 
-        self.filepath_textedit.setText(path)
-        self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.filepath_label.setText(path)
         self.clear_metadata()
         self.zlut_file_selected.emit(path)
 
@@ -4542,16 +4822,13 @@ class ZLUTPanel(ControlPanelBase):
 
     def set_filepath(self, path: str | None):
         if not path:
-            self.filepath_textedit.setText(self.NO_ZLUT_SELECTED_TEXT)
-            self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.filepath_label.setText(self.NO_ZLUT_SELECTED_TEXT)
             self.clear_metadata()
             return
 
-        self.filepath_textedit.setText(path)
-        self.filepath_textedit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.filepath_label.setText(path)
 
-        settings = QSettings('MagScope', 'MagScope')
-        settings.setValue('last zlut directory', QVariant(os.path.dirname(path)))
+        _remember_setting('last zlut directory', os.path.dirname(path))
 
     def update_metadata(self,
                         z_min: float | None = None,
@@ -0,0 +1,29 @@
+"""File dialog helpers shared across the GUI."""
+
+from __future__ import annotations
+
+from PyQt6.QtWidgets import QFileDialog, QWidget
+
+
+def open_file(
+    caption: str,
+    directory: str,
+    file_filter: str,
+    parent: QWidget | None = None,
+) -> str:
+    """Ask the user for an existing file with the platform's file picker.
+
+    ``DontUseCustomDirectoryIcons`` and ``ReadOnly`` only configure Qt's own
+    widget-based dialog (its icon provider and file model), so they keep
+    browsing a slow network share responsive only when Qt falls back to that
+    dialog; the native Windows and macOS pickers ignore them. Qt hands
+    ``DontResolveSymlinks`` to the native dialog where the platform has an
+    equivalent.
+    """
+    options = (
+        QFileDialog.Option.DontUseCustomDirectoryIcons
+        | QFileDialog.Option.DontResolveSymlinks
+        | QFileDialog.Option.ReadOnly
+    )
+    path, _ = QFileDialog.getOpenFileName(parent, caption, directory, file_filter, options=options)
+    return path
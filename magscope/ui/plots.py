@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
-from time import sleep, time
+from time import time
 from typing import TYPE_CHECKING
 import warnings
 
@@ -13,7 +13,7 @@ import matplotlib.ticker as mticker
 import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from PyQt6.QtCore import QMutex, QObject, pyqtSignal
+from PyQt6.QtCore import QMutex, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage
 
 from magscope.datatypes import MatrixBuffer
@@ -27,7 +27,69 @@ mplstyle.use('dark_background')
 mplstyle.use('fast')
 
 
+def _sorted_intersect(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the indices into ``a`` and ``b`` of the values they share.
+
+    Both arrays must be sorted and free of repeats. The result matches the
+    indices from ``np.intersect1d(a, b, assume_unique=True,
+    return_indices=True)``, but each element of the shorter array is found
+    with a binary search instead of sorting the two arrays together.
+    """
+    if a.size > b.size:
+        index_b, index_a = _sorted_intersect(b, a)
+        return index_a, index_b
+    if a.size == 0:
+        empty = np.zeros((0,), dtype=np.intp)
+        return empty, empty
+    index_b = np.searchsorted(b, a)
+    np.minimum(index_b, b.size - 1, out=index_b)
+    index_a = np.flatnonzero(b[index_b] == a)
+    return index_a, index_b[index_a]
+
+
+def _m4_downsample(t: np.ndarray, v: np.ndarray, n_bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a sorted trace to at most four points per pixel column (M4).
+
+    The time range is split into ``n_bins`` equal columns and each column
+    keeps its first, last, lowest and highest point, in time order. Drawing
+    those gives the same picture as the full trace, gaps included. Traces
+    already short enough are returned as is.
+    """
+    if n_bins <= 0 or t.size <= 4 * n_bins:
+        return t, v
+
+    # Start of each non-empty column. t is sorted, so a column is a slice
+    edges = np.linspace(t[0], t[-1], n_bins + 1)[:-1]
+    starts = np.unique(np.searchsorted(t, edges, side='left'))
+    stops = np.append(starts[1:], t.size)
+    column = np.repeat(np.arange(starts.size), stops - starts)
+
+    picks = [starts, stops - 1]
+    for reduce in (np.fmin, np.fmax):
+        # First point in each column equal to that column's extreme
+        extreme = reduce.reduceat(v, starts)
+        matches = np.flatnonzero(v == extreme[column])
+        _, first_match = np.unique(column[matches], return_index=True)
+        picks.append(matches[first_match])
+    index = np.unique(np.concatenate(picks))
+
+    return t[index], v[index]
+
+
+def _format_relative_time(seconds: float, _pos=None) -> str:
+    """Format a relative-time tick as h:m:s, wrapping at one day."""
+    minutes, secs = divmod(int(seconds // 1) % 86400, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours:02d}:{minutes:02d}:{secs:02d}'
+
+
 class PlotWorker(QObject):
+    # While live plots are switched off or have nothing new to draw, check
+    # back this often (ms)
+    IDLE_POLL_MS = 100
+    # Pause between renders, as a multiple of the time the last render took
+    RENDER_DUTY_FACTOR = 10
+
     image_signal = pyqtSignal(QImage)
     limits_signal = pyqtSignal(object)
     selected_bead_signal = pyqtSignal(int)
@@ -53,6 +115,7 @@ class PlotWorker(QObject):
 
         self.update_on: bool = True
         self._update_last_time: float
+        self._tick_timer: QTimer | None = None
 
         self.fig_width = 5
         self.fig_height = 4
@@ -62,6 +125,8 @@ class PlotWorker(QObject):
         self.time_mode = "absolute"
         self.relative_window_seconds: float | None = 300
         self._tracks_snapshot: np.ndarray | None = None
+        self._tracks_rows: dict[int, np.ndarray] = {}
+        self._last_render_state: tuple | None = None
 
         # Connect internal signal to slot
         self.limits_signal.connect(self._set_limits)
@@ -123,25 +188,53 @@ class PlotWorker(QObject):
         self._apply_time_axis_format()
 
     def run(self):
+        """ Start rendering on the worker thread's event loop.
+
+        Each render schedules the next one with a single-shot timer instead
+        of sleeping, so queued signals (limits, bead selection, figure size,
+        stop) are handled between renders.
+        """
         self._is_running = True
         self._update_last_time = time()
-        while self._is_running:
-            self.do_main_loop()
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setSingleShot(True)
+        self._tick_timer.timeout.connect(self._tick)
+        self._tick()
 
-    def do_main_loop(self):
-        # Is plotting enabled?
+    def _tick(self):
+        if not self._is_running:
+            return
         if not self.update_on:
+            self._tick_timer.start(self.IDLE_POLL_MS)
             return
 
-        # Wait for timer
-        duration = time() - self._update_last_time
-        sleep(10*duration)
         self._update_last_time = time()
+        rendered = self.do_main_loop()
+        if not self._is_running:
+            return
+        if not rendered:
+            self._tick_timer.start(self.IDLE_POLL_MS)
+            return
+        duration = time() - self._update_last_time
+        self._tick_timer.start(int(self.RENDER_DUTY_FACTOR * duration * 1000))
+
+    def do_main_loop(self) -> bool:
+        """ Render the plots and emit the image. Returns False if skipped. """
+        # Is plotting enabled?
+        if not self.update_on:
+            return False
+
+        # Skip the render if neither the data nor the view has changed
+        render_state = self._render_state()
+        if render_state is not None and render_state == self._last_render_state:
+            return False
+        self._last_render_state = render_state
 
         # Check if we need to recreate the figure
         self._recreate_figure_if_needed()
 
         self._tracks_snapshot = None
+        self._tracks_rows.clear()
         for plot in self.plots:
             if isinstance(plot, TracksTimeSeriesPlot):
                 self._tracks_snapshot = plot.buffer.peak_unsorted()
@@ -152,6 +245,7 @@ class PlotWorker(QObject):
             plot.update()
 
         self._tracks_snapshot = None
+        self._tracks_rows.clear()
 
         # Render figure to buffer
         self.canvas.draw()
@@ -164,6 +258,34 @@ class PlotWorker(QObject):
 
         # Emit figure as a buffer to the main GUI
         self.image_signal.emit(img)
+        return True
+
+    def _render_state(self) -> tuple | None:
+        """ Everything the rendered image depends on, or None if unknown.
+
+        Buffers only change through ``write``, which advances the write
+        index, so an unchanged index means unchanged data. Plots whose buffer
+        has no write index cannot be checked, and then every tick renders.
+        """
+        write_indexes = []
+        for plot in self.plots:
+            get_write_index = getattr(getattr(plot, 'buffer', None), 'get_write_index', None)
+            if get_write_index is None:
+                return None
+            write_indexes.append(get_write_index())
+
+        return (
+            tuple(write_indexes),
+            self.selected_bead,
+            self.reference_bead,
+            self.time_mode,
+            self.relative_window_seconds,
+            dict(self.limits),
+            self.fig_width,
+            self.fig_height,
+            self.dpi,
+            self.device_pixel_ratio,
+        )
 
     def add_plot(self, plot: TimeSeriesPlotBase):
         """ Used to add plots before the process has started """
@@ -220,6 +342,7 @@ class PlotWorker(QObject):
         self.canvas = None
         self.figure = None
         self._tracks_snapshot = None
+        self._tracks_rows.clear()
         self.plots = []
 
     def _update_figure_size(self, width: int, height: int, device_pixel_ratio: float):
@@ -256,9 +379,7 @@ class PlotWorker(QObject):
             return
 
         if self.time_mode == "relative":
-            formatter = mticker.FuncFormatter(
-                lambda seconds, _pos: datetime.utcfromtimestamp(seconds).strftime('%H:%M:%S')
-            )
+            formatter = mticker.FuncFormatter(_format_relative_time)
             xlabel = 'Time (relative h:m:s)'
         else:
             formatter = mdates.DateFormatter('%H:%M:%S')
@@ -311,6 +432,24 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
         super().setup()
         self.line, = self.axes.plot([], [], 'r')
 
+    def _bead_track(
+        self,
+        data: np.ndarray,
+        bead: int,
+        rows_cache: dict[int, np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """ Return the time-sorted timestamps and values of one bead.
+
+        The bead's sorted row indices are kept in ``rows_cache`` so the X, Y
+        and Z plots of one tick only look them up once.
+        """
+        rows = rows_cache.get(bead)
+        if rows is None:
+            rows = np.flatnonzero(data[:, 4] == bead)
+            rows = rows[np.argsort(data[rows, 0], kind='stable')]
+            rows_cache[bead] = rows
+        return data[rows, 0], data[rows, self.axis_index]
+
     def update(self):
         # Get selected and reference bead
         sel = self.parent.selected_bead
@@ -319,18 +458,17 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
             ref = None
 
         # Get data from buffer
+        # Row lookups are shared with the other plots only while they all
+        # read the same snapshot
         data = self.parent._tracks_snapshot
         if data is None:
             data = self.buffer.peak_unsorted()
-        data = data[np.argsort(data[:, 0], kind='stable')]
-        t = data[:, 0]
-        b = data[:, 4]
-        v = data[:, self.axis_index]
+            rows_cache = {}
+        else:
+            rows_cache = self.parent._tracks_rows
 
         # Get selected bead values
-        selection = b == sel
-        t_sel = t[selection]
-        v_sel = v[selection]
+        t_sel, v_sel = self._bead_track(data, sel, rows_cache)
 
         # Subtract reference bead values
         if ref is None:
@@ -338,11 +476,10 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
             v = v_sel
         else:
             # Get reference bead values
-            selection = b == ref
-            t_ref = t[selection]
-            v_ref = v[selection]
+            t_ref, v_ref = self._bead_track(data, ref, rows_cache)
 
-            if np.unique(t_sel).size != t_sel.size or np.unique(t_ref).size != t_ref.size:
+            # Both are sorted, so any repeated timestamp sits next to its twin
+            if np.any(t_sel[1:] == t_sel[:-1]) or np.any(t_ref[1:] == t_ref[:-1]):
                 warnings.warn(
                     'Duplicate timestamps detected while plotting referenced bead tracks.',
                     RuntimeWarning,
@@ -351,13 +488,15 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
 
             try:
                 # Get values where selected bead and reference bead share the same timepoints.
-                t, index_sel, index_ref = np.intersect1d(
-                    t_sel,
-                    t_ref,
-                    assume_unique=True,
-                    return_indices=True,
-                )
-                v = v_sel[index_sel] - v_ref[index_ref]
+                index_sel, index_ref = _sorted_intersect(t_sel, t_ref)
+                t = t_sel[index_sel]
+                v = v_sel[index_sel]
+                # Subtract in place. For Z, subtract the other way round to
+                # correct for the ZLUT's upside-down order in the same pass
+                if self.axis_name == 'Z':
+                    np.subtract(v_ref[index_ref], v, out=v)
+                else:
+                    v -= v_ref[index_ref]
             except Exception as exc:
                 warnings.warn(
                     f'Skipping referenced bead track plot update: {exc}',
@@ -370,14 +509,12 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
                 self.axes.autoscale_view()
                 return
 
-            # Correct for ZLUT upsidedown order
-            if self.axis_name == 'Z':
-                v *= -1
-
-        # Remove nan/inf
-        selection = np.isfinite(t)
-        t = t[selection]
-        v = v[selection]
+        # Remove nan/inf. t is sorted with any NaNs last, so the finite
+        # timestamps form one contiguous run and can be sliced out as views
+        start = np.searchsorted(t, -np.inf, side='right')
+        stop = np.searchsorted(t, np.inf, side='left')
+        t = t[start:stop]
+        v = v[start:stop]
 
         ymin = self.parent.limits.get(self.ylabel, (None, None))[0]
         ymax = self.parent.limits.get(self.ylabel, (None, None))[1]
@@ -392,17 +529,18 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
                 self.axes.autoscale_view()
                 return
 
+            # t is sorted, so the window is a slice off the end
             window = self.parent.relative_window_seconds
-            t_max = np.max(t)
-            xmin_value = t_max - window if window else np.min(t)
-            selection = t >= xmin_value
-            t = t[selection]
-            v = v[selection]
+            xmin_value = t[-1] - window if window else t[0]
+            start = np.searchsorted(t, xmin_value, side='left')
+            t = t[start:]
+            v = v[start:]
 
             selection = (ymin_limit <= v) & (v <= ymax_limit)
             t = t[selection]
             v = v[selection]
 
+            t, v = _m4_downsample(t, v, int(self.axes.bbox.width))
             t_relative = t - xmin_value
             xmin = 0
             xmax = window if window else None
@@ -412,10 +550,14 @@ class TracksTimeSeriesPlot(TimeSeriesPlotBase):
             xmax = self.parent.limits.get('Time', (None, None))[1]
             xmin_limit = xmin if xmin is not None else -np.inf
             xmax_limit = xmax if xmax is not None else np.inf
-            selection = (xmin_limit <= t) & (t <= xmax_limit)
-            selection &= (ymin_limit <= v) & (v <= ymax_limit)
+            start = np.searchsorted(t, xmin_limit, side='left')
+            stop = np.searchsorted(t, xmax_limit, side='right')
+            t = t[start:stop]
+            v = v[start:stop]
+            selection = (ymin_limit <= v) & (v <= ymax_limit)
             t = t[selection]
             v = v[selection]
+            t, v = _m4_downsample(t, v, int(self.axes.bbox.width))
 
             xdata = [datetime.fromtimestamp(t_) for t_ in t]
 
@@ -0,0 +1,13 @@
+"""Shared ``QSettings`` store for the GUI."""
+
+from __future__ import annotations
+
+import functools
+
+from PyQt6.QtCore import QSettings
+
+
+@functools.cache
+def shared_settings() -> QSettings:
+    """Return the GUI's shared ``QSettings`` so widgets do not reopen the store per use."""
+    return QSettings('MagScope', 'MagScope')
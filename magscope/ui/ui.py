@@ -101,6 +101,7 @@ from magscope.ui.controls import (
     ZLockPanel,
     has_tweezepy_support,
 )
+from magscope.ui.dialogs import open_file
 from magscope.ui.panel_layout import (
     PANEL_MIME_TYPE,
     PanelLayoutManager,
@@ -118,6 +119,7 @@ from magscope.ui.search import (
     SearchTarget,
     normalize_search_text,
 )
+from magscope.ui.settings import shared_settings
 from magscope.ui.theme import (
     APP_BACKGROUND_COLOR,
     PANEL_BACKGROUND_COLOR,
@@ -125,7 +127,7 @@ from magscope.ui.theme import (
     set_accent_color,
 )
 from magscope.ui.video_viewer import VideoViewer
-from magscope.ui.widgets import BeadGraphic, CollapsibleGroupBox, ResizableLabel
+from magscope.ui.widgets import BeadGraphic, CollapsibleGroupBox, ResizableLabel, signals_blocked
 from magscope.processes import ManagerProcessBase
 from magscope.scripting import ScriptStatus, register_script_command
 from magscope.settings import (
@@ -1620,17 +1622,15 @@ class UIManager(ManagerProcessBase):
         if self.controls is None or not hasattr(self.controls, 'plot_settings_panel'):
             return
         lineedit = self.controls.plot_settings_panel.selected_bead.lineedit
-        lineedit.blockSignals(True)
-        lineedit.setText(str(bead))
-        lineedit.blockSignals(False)
+        with signals_blocked(lineedit):
+            lineedit.setText(str(bead))
 
     def _sync_plot_settings_reference_bead(self, bead: int | None) -> None:
         if self.controls is None or not hasattr(self.controls, 'plot_settings_panel'):
             return
         lineedit = self.controls.plot_settings_panel.reference_bead.lineedit
-        lineedit.blockSignals(True)
-        lineedit.setText('' if bead is None or bead < 0 else str(bead))
-        lineedit.blockSignals(False)
+        with signals_blocked(lineedit):
+            lineedit.setText('' if bead is None or bead < 0 else str(bead))
 
     def _normalize_bead_id(self, bead: int | None) -> int | None:
         if bead is None or bead < 0:
@@ -3327,7 +3327,7 @@ class UIManager(ManagerProcessBase):
                 self._dock_viewer_pane(dock)
 
     def _viewer_layout_settings(self) -> QSettings:
-        return QSettings("MagScope", "MagScope")
+        return shared_settings()
 
     def _save_viewer_layout(self) -> None:
         if not self.windows:
@@ -3555,7 +3555,7 @@ class UIManager(ManagerProcessBase):
 
     def _update_view_and_hist(self):
         # Get image and _write position
-        index, image_bytes = self.video_buffer.peak_image()
+        index, image = self.video_buffer.peak_image_array()
 
         # Check if _write has changed (a new image is ready)
         if self._video_buffer_last_index != index:
@@ -3566,10 +3566,9 @@ class UIManager(ManagerProcessBase):
             dtype_bits = np.iinfo(self.video_buffer.dtype).bits
             scale = (2 ** (dtype_bits - cam_bits))
 
-            # Update the view
+            # Update the view; scaling already yields a private copy of the frame
             qt_img = QImage(
-                np.frombuffer(image_bytes, self.video_buffer.dtype).copy() *
-                scale, *self.video_buffer.image_shape,
+                image * scale, *self.video_buffer.image_shape,
                 numpy_type_to_qt_image_type(self.video_buffer.dtype))
             self.video_viewer.set_pixmap(QPixmap.fromImage(qt_img))
 
@@ -3581,7 +3580,9 @@ class UIManager(ManagerProcessBase):
             self._update_beads_in_view()
 
             # Update the histogram
-            self.controls.histogram_panel.update_plot(image_bytes)
+            histogram_panel = self.controls.histogram_panel
+            if histogram_panel.is_active:
+                histogram_panel.update_plot(image)
 
             # Increment the display rate counter
             self._display_rate_counter += 1
@@ -3917,10 +3918,10 @@ class UIManager(ManagerProcessBase):
         self.controls.status_panel.update_video_processors_status(text)
 
     def update_video_buffer_status(self):
-        level = self.video_buffer.get_level()
+        percent_full = round(self.video_buffer.get_level() * 100)
         size = self.video_buffer.n_total_images
-        text = f'{level:.0%} full, {size} max images'
-        self.controls.status_panel.update_video_buffer_status(text)
+        text = f'{percent_full}% full, {size} max images'
+        self.controls.status_panel.update_video_buffer_status(percent_full, text)
 
     def _update_display_rate(self):
         # If it has been more than a second, re-calculate the display rate
@@ -3931,9 +3932,6 @@ class UIManager(ManagerProcessBase):
             self._display_rate_counter = 0
             self._display_rate_last_rate = rate
             self.controls.status_panel.update_display_rate(f'{rate:.0f} updates/sec')
-        else:
-            # This is used to force the "..." to update
-            self.controls.status_panel.update_display_rate(f'{self._display_rate_last_rate:.0f} updates/sec')
 
     def _update_beads_in_view(self):
         # Enabled?
@@ -3969,6 +3967,10 @@ class UIManager(ManagerProcessBase):
     def update_camera_setting(self, name: str, value: str):
         self.controls.camera_panel.update_camera_setting(name, value)
 
+    @register_ipc_command(UpdateCameraSettingsCommand)
+    def update_camera_settings(self, values: dict[str, str]):
+        self.controls.camera_panel.update_camera_settings(values)
+
     @register_ipc_command(UpdateVideoBufferPurgeCommand)
     def update_video_buffer_purge(self, t: float):
         self.controls.status_panel.update_video_buffer_purge(t)
@@ -4028,35 +4030,31 @@ class UIManager(ManagerProcessBase):
     def set_acquisition_on(self, value: bool):
         super().set_acquisition_on(value)
         checkbox = self.controls.acquisition_panel.acquisition_on_checkbox.checkbox
-        checkbox.blockSignals(True) # to prevent a loop
-        checkbox.setChecked(value)
-        checkbox.blockSignals(False)
+        with signals_blocked(checkbox):  # to prevent a loop
+            checkbox.setChecked(value)
 
     @register_ipc_command(SetAcquisitionDirCommand, delivery=Delivery.BROADCAST, target='ManagerProcessBase')
     def set_acquisition_dir(self, value: str | None):
         super().set_acquisition_dir(value)
         panel = self.controls.acquisition_panel
         textedit = panel.acquisition_dir_textedit
-        textedit.blockSignals(True) # to prevent a loop
-        panel.set_acquisition_dir_text(value)
-        textedit.blockSignals(False)
+        with signals_blocked(textedit):  # to prevent a loop
+            panel.set_acquisition_dir_text(value)
 
     @register_ipc_command(SetAcquisitionDirOnCommand, delivery=Delivery.BROADCAST, target='ManagerProcessBase')
     def set_acquisition_dir_on(self, value: bool):
         super().set_acquisition_dir_on(value)
         checkbox = self.controls.acquisition_panel.acquisition_dir_on_checkbox.checkbox
-        checkbox.blockSignals(True)  # to prevent a loop
-        checkbox.setChecked(value)
-        checkbox.blockSignals(False)
+        with signals_blocked(checkbox):  # to prevent a loop
+            checkbox.setChecked(value)
         self.controls.acquisition_panel.update_save_highlight(value)
 
     @register_ipc_command(SetAcquisitionModeCommand, delivery=Delivery.BROADCAST, target='ManagerProcessBase')
     def set_acquisition_mode(self, mode: AcquisitionMode):
         super().set_acquisition_mode(mode)
         combobox = self.controls.acquisition_panel.acquisition_mode_combobox
-        combobox.blockSignals(True)  # to prevent a loop
-        combobox.setCurrentText(mode)
-        combobox.blockSignals(False)
+        with signals_blocked(combobox):  # to prevent a loop
+            combobox.setCurrentText(mode)
 
     @register_ipc_command(UpdateXYLockEnabledCommand)
     def update_xy_lock_enabled(self, value: bool):
@@ -4127,7 +4125,7 @@ class UIManager(ManagerProcessBase):
 
     @staticmethod
     def _zlut_settings() -> QSettings:
-        return QSettings('MagScope', 'MagScope')
+        return shared_settings()
 
     @staticmethod
     def _normalized_zlut_filepath(filepath: str) -> str:
@@ -4278,11 +4276,11 @@ class UIManager(ManagerProcessBase):
             os.path.expanduser('~'),
             type=str,
         )
-        path, _ = QFileDialog.getOpenFileName(
-            self.windows[0] if self.windows else None,
+        path = open_file(
             'Load Z-LUT',
             last_value,
             'Text Files (*.txt)',
+            parent=self.windows[0] if self.windows else None,
         )
         if not path:
             return
@@ -4845,7 +4843,7 @@ class LegacyDraggableControls(QWidget):
         self.panels: dict[str, ControlPanelBase | QWidget] = {}
         _set_widget_background(self, APP_BACKGROUND_COLOR)
 
-        self._settings = QSettings("MagScope", "MagScope")
+        self._settings = shared_settings()
 
         layout = QHBoxLayout(self)
         layout.setSpacing(6)
@@ -5074,7 +5072,7 @@ class LegacyDraggableControls(QWidget):
     def reset_to_defaults(self) -> None:
         """Restore panel visibility, order, and columns to defaults."""
 
-        settings = QSettings("MagScope", "MagScope")
+        settings = shared_settings()
         settings.beginGroup(self.LAYOUT_SETTINGS_GROUP)
         settings.remove("")
         settings.endGroup()
@@ -5293,7 +5291,7 @@ class Controls(QWidget):
         self.manager = manager
         self.panels: dict[str, ControlPanelBase | QWidget] = {}
         _set_widget_background(self, APP_BACKGROUND_COLOR)
-        self._settings = QSettings("MagScope", "MagScope")
+        self._settings = shared_settings()
         self._tab_widgets: list[WorkflowTabWidget] = []
         self._tab_pages: dict[str, QScrollArea] = {}
         self._tab_content_layouts: dict[str, QVBoxLayout] = {}
@@ -22,6 +22,9 @@ class VideoViewer(QGraphicsView):
     _MINIMAP_ZOOM_HEIGHT = 26
     _MINIMAP_BUTTON_SPACING = 6
 
+    # Checkerboard shown before the first frame, built on first use
+    _DEFAULT_PIXMAP: QPixmap | None = None
+
     def __init__(self, scale_factor=1.25):
         super().__init__()
         self._mouse_start_pos = QPoint()
@@ -259,13 +262,19 @@ class VideoViewer(QGraphicsView):
         self._marker_size = 0
         self.viewport().update()
 
+    @classmethod
+    def _default_pixmap(cls) -> QPixmap:
+        if cls._DEFAULT_PIXMAP is None:
+            width = 128
+            default_image = np.zeros((width, width), dtype=np.uint8)
+            default_image[1::2, 1::2] = 255
+            cls._DEFAULT_PIXMAP = QPixmap.fromImage(
+                QImage(default_image, width, width,
+                       QImage.Format.Format_Grayscale8))
+        return cls._DEFAULT_PIXMAP
+
     def set_image_to_default(self):
-        width = 128
-        default_image = np.zeros((width, width), dtype=np.uint8)
-        default_image[1::2, 1::2] = 255
-        default_pixmap = QPixmap.fromImage(
-            QImage(default_image, width, width,
-                   QImage.Format.Format_Grayscale8))
+        default_pixmap = self._default_pixmap()
         self._empty = False
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self._image.setPixmap(default_pixmap)
@@ -3,22 +3,58 @@ Miscellaneous custom Qt widgets for the GUI
 """
 from __future__ import annotations
 
+import weakref
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import (QEasingCurve, QMimeData, QPoint, QPointF, QPropertyAnimation, QRect,
-                          QRectF, QSize, QSettings, Qt, QTimer, pyqtSignal)
+from PyQt6.QtCore import (QEasingCurve, QMimeData, QObject, QPoint, QPointF, QPropertyAnimation,
+                          QRect, QRectF, QSize, Qt, QTimer, pyqtSignal)
 from PyQt6.QtGui import QBrush, QColor, QDrag, QFont, QPainter, QPalette, QPen, QValidator
 from PyQt6.QtWidgets import (QCheckBox, QFrame, QGraphicsItem, QGraphicsRectItem,
                              QGraphicsSimpleTextItem, QGroupBox, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QScrollArea, QSizePolicy, QSplitter,
                              QSplitterHandle, QVBoxLayout, QWidget)
 
+from magscope.ui.settings import shared_settings
 from magscope.ui.theme import PANEL_BACKGROUND_COLOR
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from magscope.ui.ui import UIManager
 
 
+@contextmanager
+def signals_blocked(*objects: QObject) -> Iterator[None]:
+    """Block the signals of ``objects`` for the duration of the ``with`` block.
+
+    Use this when pushing state into widgets programmatically so their change
+    signals do not echo back through the callbacks. Each object's previous
+    blocked state is restored on exit, even if the block raises.
+    """
+    previous = [obj.blockSignals(True) for obj in objects]
+    try:
+        yield
+    finally:
+        for obj, was_blocked in zip(objects, previous):
+            obj.blockSignals(was_blocked)
+
+
+@contextmanager
+def updates_suspended(widget: QWidget) -> Iterator[None]:
+    """Hold off repainting ``widget`` while several of its children change.
+
+    Qt repaints once when updates are re-enabled, instead of after each
+    intermediate visibility, text, or enabled-state change.
+    """
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(was_enabled)
+
+
 class LabeledLineEditWithValue(QWidget):
     """Horizontally combined QLabel, QLineedit, and a second QLabel to show the value."""
 
@@ -92,12 +128,32 @@ class LabeledLineEdit(QWidget):
         self.lineedit = QLineEdit(default)
         if validator:
             self.lineedit.setValidator(validator)
+
+        # Parsed lazily and dropped whenever the text changes. Connected ahead
+        # of the callback so the callback can use value() instead of re-parsing.
+        self._value: float | None = None
+        self._value_stale = True
+        self.lineedit.textChanged.connect(self._invalidate_value)  # type: ignore
+
         if callback:
             self.lineedit.textChanged.connect(callback)  # type: ignore
         if widths[1] > 0:
             self.lineedit.setFixedWidth(widths[1])
         self.layout.addWidget(self.lineedit)
 
+    def value(self) -> float | None:
+        """Return the text as a float, or ``None`` if it is not a number."""
+        if self._value_stale:
+            try:
+                self._value = float(self.lineedit.text())
+            except ValueError:
+                self._value = None
+            self._value_stale = False
+        return self._value
+
+    def _invalidate_value(self) -> None:
+        self._value_stale = True
+
 
 class LabeledCheckbox(QWidget):
     """Horizontally combined QLabel and QCheckbox."""
@@ -186,6 +242,8 @@ class LabeledStepperLineEdit(QWidget):
 class CollapsibleGroupBox(QGroupBox):
     """A titled QGroupBox that can optionally collapse its content."""
 
+    collapsed_changed = pyqtSignal(bool)
+
     _DEFAULT_BORDER_COLOR = "palette(mid)"
     _DEFAULT_BORDER_WIDTH = 1
 
@@ -201,7 +259,7 @@ class CollapsibleGroupBox(QGroupBox):
         self._apply_panel_style()
 
         # Retrieve last collapse state
-        settings = QSettings('MagScope', 'MagScope')
+        settings = shared_settings()
         collapsed = settings.value(self._settings_key, collapsed, type=bool) if collapsible else False
 
         # Set up the toggle button (will be the groupbox's title)
@@ -308,16 +366,16 @@ class CollapsibleGroupBox(QGroupBox):
             animate = False
             persist = False
         expanded = not collapsed
+        changed = collapsed != self.collapsed
         self.collapsed = collapsed
-        self.toggle_button.blockSignals(True)
-        self.toggle_button.setChecked(expanded)
-        self.toggle_button.blockSignals(False)
+        with signals_blocked(self.toggle_button):
+            self.toggle_button.setChecked(expanded)
         self.toggle_button.setText(
             self._get_toggle_text(self.title, expanded, collapsible=self.collapsible)
         )
 
         if persist:
-            settings = QSettings('MagScope', 'MagScope')
+            settings = shared_settings()
             settings.setValue(self._settings_key, self.collapsed)
 
         if animate:
@@ -338,6 +396,9 @@ class CollapsibleGroupBox(QGroupBox):
             else:
                 self.content_area.setMaximumHeight(16777215)  # QT default maximum
 
+        if changed:
+            self.collapsed_changed.emit(collapsed)
+
     def setContentLayout(self, content_layout):
         wrapper_layout = QVBoxLayout()
         wrapper_layout.setContentsMargins(5, 0, 5, 5)
@@ -442,7 +503,7 @@ class GripSplitter(QSplitter):
         super().showEvent(e)
         if self.setting_name and not self.shown_once:
             self.shown_once = True
-            settings = QSettings('MagScope', 'MagScope')
+            settings = shared_settings()
             sizes = settings.value(self.setting_name, None, list)
             if sizes:
                 sizes = list(map(int, sizes))
@@ -456,7 +517,7 @@ class GripSplitter(QSplitter):
 
     def handle_released(self):
         if self.setting_name:
-            settings = QSettings('MagScope', 'MagScope')
+            settings = shared_settings()
             settings.setValue(self.setting_name, self.sizes())
 
 
@@ -847,16 +908,49 @@ class BeadGraphic(QGraphicsRectItem):
 
 
 class FlashLabel(QLabel):
+    # One timer drives every label that is currently flashing, so idle labels
+    # cost nothing and concurrent flashes share a single event-loop wakeup
+    _flash_interval_ms = 15
+    _flashing: weakref.WeakSet[FlashLabel] = weakref.WeakSet()
+    _shared_timer: QTimer | None = None
+
     def __init__(self, text=""):
         super().__init__(text)
         self._flash_progress = 0.0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_flash)
         self._step = 0
 
         # Set initial white text color
         self.setStyleSheet("color: white;")
 
+    @property
+    def is_flashing(self) -> bool:
+        return self in FlashLabel._flashing
+
+    @classmethod
+    def _start_flashing(cls, label: FlashLabel) -> None:
+        cls._flashing.add(label)
+        if cls._shared_timer is None:
+            cls._shared_timer = QTimer()
+            cls._shared_timer.setInterval(cls._flash_interval_ms)
+            cls._shared_timer.timeout.connect(cls._tick_all)
+        if not cls._shared_timer.isActive():
+            cls._shared_timer.start()
+
+    @classmethod
+    def _stop_flashing(cls, label: FlashLabel) -> None:
+        cls._flashing.discard(label)
+        if not cls._flashing and cls._shared_timer is not None:
+            cls._shared_timer.stop()
+
+    @classmethod
+    def _tick_all(cls) -> None:
+        for label in list(cls._flashing):
+            try:
+                label._update_flash()
+            except RuntimeError:
+                # The underlying widget was deleted mid-flash
+                cls._stop_flashing(label)
+
     def _update_flash(self):
         self._step += 1
 
@@ -875,18 +969,16 @@ class FlashLabel(QLabel):
 
         # Stop after 40 steps
         if self._step >= 40:
-            self._timer.stop()
+            FlashLabel._stop_flashing(self)
             self._step = 0
             self.setStyleSheet("color: white;")
 
     def setText(self, text):
         if text != self.text():
             super().setText(text)
-            # Start flash animation
-            if self._timer.isActive():
-                self._timer.stop()
+            # Start (or restart) the flash animation
             self._step = 0
-            self._timer.start(15)
+            FlashLabel._start_flashing(self)
         else:
             super().setText(text)
 
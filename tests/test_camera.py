@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 import magscope.camera as camera
-from magscope.ipc_commands import UpdateCameraSettingCommand
+from magscope.ipc_commands import UpdateCameraSettingsCommand
 
 
 class FakeValue:
@@ -277,8 +277,7 @@ def test_camera_manager_setup_connects_camera_and_broadcasts_initial_settings():
     assert fake_camera.reset_called is True
     assert fake_camera.connected_buffer is video_buffer
     assert sent_commands == [
-        UpdateCameraSettingCommand(name='framerate', value='30'),
-        UpdateCameraSettingCommand(name='gain', value='1'),
+        UpdateCameraSettingsCommand(values={'framerate': '30', 'gain': '1'}),
     ]
 
 
@@ -426,8 +425,7 @@ def test_camera_manager_set_camera_setting_warns_and_rebroadcasts_on_error():
 
     assert fake_camera.set_calls == [('gain', '5')]
     assert sent_commands == [
-        UpdateCameraSettingCommand(name='framerate', value='30'),
-        UpdateCameraSettingCommand(name='gain', value='1'),
+        UpdateCameraSettingsCommand(values={'framerate': '30', 'gain': '1'}),
     ]
 
 
@@ -442,8 +440,7 @@ def test_camera_manager_set_camera_setting_uses_repr_for_empty_error_message():
         manager.set_camera_setting('gain', '5')
 
     assert sent_commands == [
-        UpdateCameraSettingCommand(name='framerate', value='30'),
-        UpdateCameraSettingCommand(name='gain', value='1'),
+        UpdateCameraSettingsCommand(values={'framerate': '30', 'gain': '1'}),
     ]
 
 
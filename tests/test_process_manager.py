@@ -1,4 +1,5 @@
 import importlib.util
+import pstats
 import sys
 import types
 from dataclasses import dataclass
@@ -263,6 +264,29 @@ def test_run_validates_dependencies(fake_buffers):
     assert len(fake_buffers["BeadRoiBuffer"]) == 1
     assert len(fake_buffers["MatrixBuffer"]) == 2
     assert len(fake_buffers["VideoBuffer"]) == 1
+
+
+def test_run_writes_profile_when_profile_dir_is_set(tmp_path):
+    proc = DummyProcess()
+    registry = CommandRegistry()
+    registry.register_manager(proc)
+    profile_dir = tmp_path / "profiles"
+    proc.configure_shared_resources(
+        camera_type=None,
+        hardware_types={},
+        quitting_event=FakeEvent(),
+        settings=FakeSettings(),
+        shared_values=processes.InterprocessValues(),
+        locks={"BeadRoiBuffer": object(), "LiveProfileBuffer": object()},
+        pipe_end=FakePipe(),
+        command_registry=registry,
+        profile_dir=str(profile_dir),
+    )
+
+    proc.run()
+
+    stats = pstats.Stats(str(profile_dir / "DummyProcess.prof"))
+    assert any(name == "do_main_loop" for _file, _line, name in stats.stats)
 
 
 def test_receive_ipc_dispatch_and_quit_flag():
@@ -402,6 +426,8 @@ class FakeHardwareBuffer:
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
+        self.shape = (16, 4)
+        self.dtype = np.dtype(np.float64)
         self.rows = []
         self._unread_rows = []
 
@@ -410,11 +436,14 @@ class FakeHardwareBuffer:
         self.rows.append(copied)
         self._unread_rows.append(copied)
 
-    def read(self):
+    def read(self, out=None):
         if not self._unread_rows:
             return np.empty((0, 0), dtype=float)
         unread = np.vstack(self._unread_rows)
         self._unread_rows.clear()
+        if out is not None:
+            out[:len(unread)] = unread
+            return out[:len(unread)]
         return unread
 
 
@@ -585,7 +614,7 @@ def test_hardware_manager_save_skips_empty_buffer(monkeypatch, tmp_path):
     motor._acquisition_dir_on = True
     motor.setup()
 
-    motor._buffer.read = lambda: np.empty((0, 0), dtype=float)
+    motor._buffer.read = lambda out=None: np.empty((0, 0), dtype=float)
     motor._save_pending_data_if_enabled()
 
     assert not (tmp_path / f"{motor.name}.txt").exists()
@@ -126,6 +126,7 @@ def load_scope_with_stubs(monkeypatch):
             locks,
             pipe_end,
             command_registry,
+            profile_dir=None,
         ) -> None:
             self.pipe_end = pipe_end
             self._quitting = quitting_event
@@ -1332,6 +1333,7 @@ def test_configure_processes_assigns_shared_resources(scope_module, monkeypatch)
     assert kwargs["locks"] is scope.locks
     assert kwargs["pipe_end"] is child_pipe
     assert kwargs["command_registry"] is scope.command_registry
+    assert kwargs["profile_dir"] is None
     assert scope.quitting_events == {process.name: scope._quitting}
 
 
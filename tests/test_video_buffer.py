@@ -18,6 +18,7 @@ BufferUnderflow = datatypes.BufferUnderflow
 BeadRoiBuffer = datatypes.BeadRoiBuffer
 DatasetNotReadyError = datatypes.DatasetNotReadyError
 MatrixBuffer = datatypes.MatrixBuffer
+RingIndex = datatypes.RingIndex
 VideoBuffer = datatypes.VideoBuffer
 ZLUTSweepDataset = datatypes.ZLUTSweepDataset
 int_to_uint_dtype = datatypes.int_to_uint_dtype
@@ -137,6 +138,32 @@ class TestVideoBuffer(VideoBufferTestCase):
         with self.assertRaises(BufferUnderflow):
             self.buffer.read_image()
 
+    def test_write_image_accepts_arrays_and_rejects_wrong_size(self):
+        width, height = self.buffer.image_shape
+        frame = np.arange(width * height, dtype=self.buffer.dtype).reshape((height, width))
+
+        self.buffer.write_image_and_timestamp(frame, 2.5)
+        restored, timestamp = self.buffer.read_image()
+        np.testing.assert_array_equal(restored, frame.T)
+        self.assertAlmostEqual(timestamp, 2.5)
+
+        with self.assertRaises(ValueError):
+            self.buffer.write_image_and_timestamp(frame.tobytes()[:-1], 3.0)
+
+    def test_peak_image_array_is_read_only_row_major_view(self):
+        width, height = self.buffer.image_shape
+        frame = np.arange(width * height, dtype=self.buffer.dtype).reshape((height, width))
+        self.buffer.write_image_and_timestamp(frame, 1.0)
+
+        index, image = self.buffer.peak_image_array()
+        try:
+            self.assertEqual(index, 0)
+            np.testing.assert_array_equal(image, frame)
+            self.assertFalse(image.flags.writeable)
+        finally:
+            # The view pins the shared memory until it is released
+            del image
+
     def test_peak_stack_returns_unread_frames(self):
         images = []
         timestamps = []
@@ -247,12 +274,60 @@ class TestMatrixBuffer(MatrixBufferTestCase):
         restored = self.buffer.read()
         np.testing.assert_array_equal(restored, second)
 
+    def test_read_into_preallocated_out(self):
+        out = np.full(self.buffer.shape, -1.0)
+        first = np.arange(3 * self.buffer.shape[1], dtype=self.buffer.dtype).reshape(3, self.buffer.shape[1])
+        self.buffer.write(first)
+        restored = self.buffer.read(out=out)
+        np.testing.assert_array_equal(restored, first)
+        self.assertTrue(np.shares_memory(restored, out))
+
+        second = (np.arange(2 * self.buffer.shape[1], dtype=self.buffer.dtype) + 100).reshape(2, self.buffer.shape[1])
+        self.buffer.write(second)
+        restored = self.buffer.read(out=out)
+        np.testing.assert_array_equal(restored, second)
+        self.assertTrue(np.shares_memory(restored, out))
+
+    def test_read_rejects_bad_out_without_consuming_rows(self):
+        data = np.arange(3 * self.buffer.shape[1], dtype=self.buffer.dtype).reshape(3, self.buffer.shape[1])
+        self.buffer.write(data)
+
+        for out in (
+            np.empty((2, self.buffer.shape[1]), dtype=self.buffer.dtype),
+            np.empty((3, self.buffer.shape[1] + 1), dtype=self.buffer.dtype),
+            np.empty((3, self.buffer.shape[1]), dtype=np.float32),
+        ):
+            with self.assertRaises(ValueError):
+                self.buffer.read(out=out)
+            self.assertEqual(self.buffer.get_count_index(), data.nbytes)
+
+        np.testing.assert_array_equal(self.buffer.read(), data)
+
+    def test_read_after_overrun_returns_newest_full_buffer(self):
+        rows = np.arange(6 * self.buffer.shape[1], dtype=self.buffer.dtype).reshape(6, self.buffer.shape[1])
+        self.buffer.write(rows[:3])
+        self.buffer.write(rows[3:])
+        self.assertEqual(self.buffer.get_count_index(), self.buffer.nbytes)
+
+        restored = self.buffer.read()
+        np.testing.assert_array_equal(restored, rows[2:])
+        self.assertEqual(self.buffer.get_count_index(), 0)
+
     def test_peak_sorted_returns_fifo_view(self):
         data = np.arange(2 * self.buffer.shape[1], dtype=self.buffer.dtype).reshape(2, self.buffer.shape[1])
         self.buffer.write(data)
         peak = self.buffer.peak_sorted()
         np.testing.assert_array_equal(peak[-2:], data)
 
+    def test_peak_sorted_after_wrap(self):
+        first = np.arange(3 * self.buffer.shape[1], dtype=self.buffer.dtype).reshape(3, self.buffer.shape[1])
+        second = first + 100
+        self.buffer.write(first)
+        self.buffer.write(second)
+
+        peak = self.buffer.peak_sorted()
+        np.testing.assert_array_equal(peak, np.vstack((first[2:], second)))
+
     def test_write_input_validation(self):
         with self.assertRaises(AssertionError):
             self.buffer.write(np.zeros((self.buffer.shape[0] + 1, self.buffer.shape[1]), dtype=self.buffer.dtype))
@@ -537,6 +612,33 @@ class TestZLUTSweepDataset(ZLUTSweepDatasetTestCase):
                 leaked.close()
 
 
+class TestRingIndex(unittest.TestCase):
+    def setUp(self):
+        self.storage = bytearray(RingIndex.SIZE)
+        self.index = RingIndex(memoryview(self.storage), modulus=4)
+
+    def test_advance_wraps_and_tracks_count(self):
+        self.index.advance_write(3)
+        self.assertEqual((self.index.read, self.index.write, self.index.count), (0, 3, 3))
+        self.assertEqual(self.index.free(), 1)
+
+        self.index.advance_read(2)
+        self.index.advance_write(2)
+        self.assertEqual((self.index.read, self.index.write, self.index.count), (2, 1, 3))
+        self.assertEqual(self.index.free(), 1)
+
+    def test_overrun_drops_oldest_units(self):
+        self.index.advance_write(3)
+        self.index.advance_write(3)
+        self.assertEqual((self.index.read, self.index.write, self.index.count), (2, 2, 4))
+
+    def test_values_are_little_endian_uint64(self):
+        self.index.advance_write(1)
+        self.assertEqual(self.storage[8:16], (1).to_bytes(8, byteorder='little'))
+        self.index.reset()
+        self.assertEqual(bytes(self.storage), bytes(RingIndex.SIZE))
+
+
 class TestIntToUintDtype(unittest.TestCase):
     def test_success_and_failure(self):
         self.assertEqual(int_to_uint_dtype(8), np.uint8)
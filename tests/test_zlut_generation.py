@@ -184,6 +184,18 @@ def test_save_generated_zlut_without_loading_keeps_evaluation_active(monkeypatch
     assert any(isinstance(command, UpdateZLUTGenerationEvaluationCommand) for command in manager._sent_commands)
 
 
+def test_save_generated_zlut_round_trips_through_text(tmp_path):
+    zlut_array = np.asarray([[-1234.5678901, 0.0, 2.5], [0.123456789012, np.nan, 1e-7]])
+    manager = make_manager()
+    manager._phase = 'evaluating'
+    manager._generated_zluts = {3: type('Result', (), {'zlut_array': zlut_array})()}
+
+    filepath = tmp_path / 'generated.txt'
+    manager.save_generated_zlut(str(filepath), 3, load_after_save=False)
+
+    np.testing.assert_array_equal(np.loadtxt(filepath), zlut_array)
+
+
 def test_save_generated_zlut_missing_directory_clears_pending_load_request(tmp_path):
     manager = make_manager()
     manager._phase = 'evaluating'
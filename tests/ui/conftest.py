@@ -12,6 +12,16 @@ pytest.importorskip("PyQt6")
 
 from PyQt6.QtWidgets import QWidget
 
+from magscope.ui.settings import shared_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_settings():
+    """Reopen the cached GUI QSettings so per-test settings paths apply."""
+    shared_settings.cache_clear()
+    yield
+    shared_settings.cache_clear()
+
 
 @pytest.fixture
 def widget_parent(qtbot):
@@ -8,6 +8,7 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 pytest.importorskip("pytestqt")
@@ -16,7 +17,12 @@ pytest.importorskip("PyQt6")
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtWidgets import QWidget
 
-from magscope.ipc_commands import StartNewTrackingDataFileCommand, UpdateSettingsCommand
+from magscope.ipc_commands import (
+    GetCameraSettingsCommand,
+    SetCameraSettingCommand,
+    StartNewTrackingDataFileCommand,
+    UpdateSettingsCommand,
+)
 from magscope.settings import (
     MagScopeSettings,
     SAVE_TRACKING_ROI_POSITIONS_SETTING,
@@ -29,7 +35,10 @@ from magscope.ui.controls import (
     BeadSelectionPanel,
     CameraPanel,
     HelpPanel,
+    HistogramPanel,
     MagScopeSettingsPanel,
+    PlotSettingsPanel,
+    ProfilePanel,
     SavingSettingsPanel,
     ScriptPanel,
     StatusPanel,
@@ -37,7 +46,10 @@ from magscope.ui.controls import (
     _LockActivityIndicator,
     _LockNumberInput,
     _LockStatusBadge,
+    _intensity_histogram,
+    _roi_pixel_indices,
 )
+from magscope.utils import AcquisitionMode
 
 
 # ---------------------------------------------------------------------------
@@ -87,39 +99,80 @@ def test_lock_status_badge_unknown_state_defaults_to_inactive_colors(qtbot):
 # StatusPanel
 # ---------------------------------------------------------------------------
 
-def test_status_panel_update_display_rate_increments_dots(qtbot):
+def test_status_panel_dot_timer_increments_dots(qtbot):
     panel = StatusPanel(manager=SimpleNamespace())
     qtbot.addWidget(panel)
+    panel._dot_timer.stop()
+    panel._tick_dots()
+    assert panel.display_rate_status.text() == ""
+
     panel.update_display_rate("30.0 fps")
-    panel.update_display_rate("30.0 fps")
-    assert ".." in panel.display_rate_status.text()
+    panel._tick_dots()
+    panel._tick_dots()
+    assert panel.display_rate_status.text() == "Display Rate: 30.0 fps .."
 
     for _ in range(2):
-        panel.update_display_rate("30.0 fps")
+        panel._tick_dots()
     assert panel.dot_count == 0
     assert "Display Rate" in panel.display_rate_status.text()
 
 
+def test_status_panel_update_display_rate_skips_unchanged_text(qtbot):
+    panel = StatusPanel(manager=SimpleNamespace())
+    qtbot.addWidget(panel)
+    panel._dot_timer.stop()
+    panel.update_display_rate("30.0 fps")
+    panel.display_rate_status.setText("sentinel")
+
+    panel.update_display_rate("30.0 fps")
+    assert panel.display_rate_status.text() == "sentinel"
+
+    panel.update_display_rate("31.0 fps")
+    assert panel.display_rate_status.text() == "Display Rate: 31.0 fps "
+
+
 def test_status_panel_update_video_processors_status(qtbot):
     panel = StatusPanel(manager=SimpleNamespace())
     qtbot.addWidget(panel)
     panel.update_video_processors_status("2/4 busy")
+    panel._flush_status()
     assert "Video Processors: 2/4 busy" in panel.video_processors_status.text()
 
 
-def test_status_panel_update_video_buffer_status_parses_percent(qtbot):
+def test_status_panel_update_video_buffer_status_sets_percent_and_text(qtbot):
     panel = StatusPanel(manager=SimpleNamespace())
     qtbot.addWidget(panel)
-    panel.update_video_buffer_status("75% full")
+    panel.update_video_buffer_status(75, "75% full")
+    panel._flush_status()
     assert "Video Buffer: 75% full" in panel.video_buffer_status.text()
     assert panel.video_buffer_status_bar.value() == 75
 
 
-def test_status_panel_update_video_buffer_status_invalid_percent(qtbot):
+def test_status_panel_coalesces_video_buffer_bar_until_flush(qtbot):
     panel = StatusPanel(manager=SimpleNamespace())
     qtbot.addWidget(panel)
-    panel.update_video_buffer_status("not a number")
-    assert panel.video_buffer_status_bar.value() == 0
+
+    panel.update_video_buffer_status(10, "10% full")
+    panel.update_video_buffer_status(40, "40% full")
+    assert panel.video_buffer_status_bar.value() != 40
+
+    panel._status_flush_timer.stop()
+    panel._flush_status()
+    assert panel.video_buffer_status_bar.value() == 40
+    assert panel._pending_buffer_percent is None
+
+
+def test_status_panel_coalesces_status_text_until_flush(qtbot):
+    panel = StatusPanel(manager=SimpleNamespace())
+    qtbot.addWidget(panel)
+
+    panel.update_video_processors_status("1/4 busy")
+    panel.update_video_processors_status("3/4 busy")
+    assert panel.video_processors_status.text() == ""
+    assert panel._status_flush_timer.isActive()
+
+    qtbot.waitUntil(lambda: panel.video_processors_status.text() != "", timeout=1000)
+    assert panel.video_processors_status.text() == "Video Processors: 3/4 busy"
 
 
 def test_status_panel_update_video_buffer_purge(qtbot):
@@ -130,6 +183,207 @@ def test_status_panel_update_video_buffer_purge(qtbot):
     assert panel.video_buffer_purge_label.text() == f"Video Buffer Purged at: {expected}"
 
 
+# ---------------------------------------------------------------------------
+# HistogramPanel
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(("dtype", "bits"), [(np.uint8, 8), (np.uint16, 12), (np.uint16, 16), (np.uint8, 6)])
+def test_intensity_histogram_matches_np_histogram(dtype, bits):
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 2 ** bits, size=(37, 53), dtype=dtype)
+
+    expected, _ = np.histogram(pixels, bins=256, range=(0, 2 ** bits))
+    np.testing.assert_array_equal(_intensity_histogram(pixels, bits, 256), expected)
+
+    scratch = np.empty(pixels.size, dtype=dtype)
+    np.testing.assert_array_equal(_intensity_histogram(pixels, bits, 256, out=scratch), expected)
+
+
+def test_roi_pixel_indices_match_slicing_and_clip_to_frame():
+    frame = np.arange(5 * 7).reshape(5, 7)
+    rois = np.array([[1, 3, 0, 2], [5, 9, 3, 6]])
+
+    indices = _roi_pixel_indices(rois, frame.shape)
+
+    expected = np.concatenate([frame[y0:y1, x0:x1].ravel() for x0, x1, y0, y1 in rois])
+    np.testing.assert_array_equal(frame.ravel()[indices], expected)
+
+
+def _make_histogram_panel(qtbot, bead_rois):
+    manager = SimpleNamespace(
+        camera_type=SimpleNamespace(dtype=np.uint8, bits=8),
+        video_buffer=SimpleNamespace(image_shape=(4, 2)),
+        bead_rois=np.asarray(bead_rois, dtype=np.uint32).reshape((-1, 4)),
+    )
+    manager.get_cached_bead_rois = lambda: (np.arange(len(manager.bead_rois)), manager.bead_rois)
+    panel = HistogramPanel(manager=manager)
+    qtbot.addWidget(panel)
+    panel.enable_checkbox.checkbox.setChecked(True)
+    panel.groupbox.toggle(True)
+    panel.groupbox.animation.stop()
+    panel.update_interval = 0
+    return panel
+
+
+def test_histogram_panel_only_rois_crops_in_row_major_layout(qtbot):
+    panel = _make_histogram_panel(qtbot, [(1, 3, 0, 1)])
+    assert panel.is_active
+    panel.only_beads_checkbox.checkbox.setChecked(True)
+
+    # 4 px wide, 2 px high; the ROI covers x=1..2 of the first row
+    frame = np.array([[0, 5, 5, 0], [9, 9, 9, 9]], dtype=np.uint8)
+    panel.update_plot(frame)
+
+    heights = panel.bars.get_data().values
+    expected = np.zeros(256)
+    expected[5] = np.log1p(2)
+    np.testing.assert_allclose(heights, expected)
+
+
+def test_histogram_panel_rebuilds_roi_indices_only_when_rois_are_replaced(qtbot):
+    panel = _make_histogram_panel(qtbot, [(1, 3, 0, 1)])
+    panel.only_beads_checkbox.checkbox.setChecked(True)
+    frame = np.array([[0, 5, 5, 0], [9, 9, 9, 9]], dtype=np.uint8)
+
+    panel.update_plot(frame)
+    indices = panel._roi_indices
+    panel.update_plot(frame)
+    assert panel._roi_indices is indices
+
+    panel.manager.bead_rois = np.array([[0, 4, 1, 2]], dtype=np.uint32)
+    panel.update_plot(frame)
+    np.testing.assert_array_equal(panel._roi_indices, [4, 5, 6, 7])
+    assert panel.bars.get_data().values[9] == pytest.approx(np.log1p(4))
+
+
+def test_histogram_panel_clear_redraws_only_after_new_data(qtbot, monkeypatch):
+    panel = _make_histogram_panel(qtbot, bead_rois=np.zeros((0, 4), dtype=int))
+    draws = []
+    monkeypatch.setattr(panel.canvas, "draw", lambda: draws.append(True))
+
+    panel.clear()
+    panel.clear()
+    assert draws == []
+
+    panel.only_beads_checkbox.checkbox.setChecked(False)
+    panel.update_plot(np.array([[0, 5, 5, 0], [9, 9, 9, 9]], dtype=np.uint8))
+    panel.clear()
+    panel.clear()
+    assert len(draws) == 2
+    assert not panel.bars.get_data().values.any()
+
+
+# ---------------------------------------------------------------------------
+# ProfilePanel
+# ---------------------------------------------------------------------------
+
+def test_profile_panel_plots_only_finite_profile_samples(qtbot):
+    entry = np.full(10, np.nan)
+    entry[1] = 3  # bead id
+    entry[2] = 5  # profile length
+    entry[3:8] = [4.0, np.nan, 6.0, 2.0, np.nan]
+    manager = SimpleNamespace(
+        selected_bead=3,
+        shared_values=SimpleNamespace(live_profile_enabled=SimpleNamespace(value=True)),
+        live_profile_buffer=SimpleNamespace(peak_unsorted=lambda: entry[None, :]),
+        set_live_profile_monitor_enabled=lambda _enabled: None,
+    )
+    panel = ProfilePanel(manager=manager)
+    qtbot.addWidget(panel)
+    panel.enable.checkbox.setChecked(True)
+    panel.groupbox.toggle(True)
+    panel.groupbox.animation.stop()
+
+    panel.update_plot()
+
+    np.testing.assert_array_equal(panel.line.get_xdata(), [0, 2, 3])
+    np.testing.assert_array_equal(panel.line.get_ydata(), [4.0, 6.0, 2.0])
+    assert panel.axes.get_xlim() == (0.0, 3.0)
+    assert panel.axes.get_ylim() == (0.0, 6.0)
+    assert panel.profile_length_label.text() == '5'
+
+
+# ---------------------------------------------------------------------------
+# PlotSettingsPanel
+# ---------------------------------------------------------------------------
+
+def test_plot_settings_panel_debounces_limit_edits(qtbot):
+    limits_sent = []
+    windows_sent = []
+    manager = SimpleNamespace(
+        plot_worker=SimpleNamespace(
+            plots=[SimpleNamespace(ylabel='X')],
+            limits_signal=SimpleNamespace(emit=limits_sent.append),
+            relative_window_signal=SimpleNamespace(emit=windows_sent.append),
+            time_mode_signal=SimpleNamespace(emit=lambda mode: None),
+        ),
+    )
+    panel = PlotSettingsPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    for text in ('1', '12', '12.5'):
+        panel.limits['X'][0].setText(text)
+    for text in ('00:1', '00:10'):
+        panel.time_relative_window.setText(text)
+    assert limits_sent == []
+    assert windows_sent == []
+
+    qtbot.waitUntil(lambda: bool(limits_sent and windows_sent), timeout=1000)
+    qtbot.wait(PlotSettingsPanel.EDIT_DEBOUNCE_MS * 2)
+    assert len(limits_sent) == 1
+    assert limits_sent[0]['X'] == (12.5, None)
+    assert windows_sent == [600]
+
+
+def test_plot_settings_panel_limit_inputs_share_setup(qtbot):
+    manager = SimpleNamespace(
+        plot_worker=SimpleNamespace(plots=[SimpleNamespace(ylabel='X'), SimpleNamespace(ylabel='Z')]),
+    )
+    panel = PlotSettingsPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    assert list(panel.limits) == ['X', 'Z', 'Time']
+    for lower, upper in panel.limits.values():
+        assert lower.placeholderText() == upper.placeholderText() == 'auto'
+
+    panel.limits['Time'][1].setText('12:00:00')
+    assert panel._limits_debounce.isActive()
+    panel._limits_debounce.stop()
+
+
+def test_plot_settings_panel_skips_unchanged_payloads(qtbot):
+    limits_sent = []
+    windows_sent = []
+    manager = SimpleNamespace(
+        plot_worker=SimpleNamespace(
+            plots=[SimpleNamespace(ylabel='X')],
+            limits_signal=SimpleNamespace(emit=limits_sent.append),
+            relative_window_signal=SimpleNamespace(emit=windows_sent.append),
+            time_mode_signal=SimpleNamespace(emit=lambda mode: None),
+        ),
+    )
+    panel = PlotSettingsPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    panel.limits['X'][0].setText('1')
+    panel.limits_callback(None)
+    panel.limits['X'][0].setText('1.0')
+    panel.limits_callback(None)
+    panel.time_relative_window.setText('00:10')
+    panel.relative_time_window_callback(None)
+    panel.time_relative_window.setText('0:10')
+    panel.relative_time_window_callback(None)
+
+    assert [limits['X'] for limits in limits_sent] == [(1.0, None)]
+    assert windows_sent == [600]
+
+    panel.limits['X'][0].setText('2')
+    panel.limits_callback(None)
+    assert [limits['X'] for limits in limits_sent] == [(1.0, None), (2.0, None)]
+    panel._limits_debounce.stop()
+    panel._relative_window_debounce.stop()
+
+
 # ---------------------------------------------------------------------------
 # CameraPanel
 # ---------------------------------------------------------------------------
@@ -166,6 +420,52 @@ def test_camera_panel_update_camera_setting(qtbot):
     assert panel._last_settings_update is not None
 
 
+def test_camera_panel_builds_setting_rows_on_first_show(qtbot):
+    manager = SimpleNamespace(camera_type=SimpleNamespace(settings=["Exposure", "Gain"]))
+    panel = CameraPanel(manager=manager)
+    qtbot.addWidget(panel)
+    assert panel.settings == {}
+
+    panel.show()
+    assert list(panel.settings) == ["Exposure", "Gain"]
+    rows = dict(panel.settings)
+
+    panel.hide()
+    panel.show()
+    assert panel.settings == rows
+    assert panel._settings_layout.count() == 2
+
+
+def test_camera_panel_setting_edit_sends_its_own_name(qtbot):
+    manager = SimpleNamespace(camera_type=SimpleNamespace(settings=["Exposure", "Gain"]))
+    sent = []
+    manager.send_ipc = sent.append
+    panel = CameraPanel(manager=manager)
+    qtbot.addWidget(panel)
+    panel.show()
+
+    panel.settings["Gain"].lineedit.setText("3")
+    panel.settings["Gain"].lineedit.editingFinished.emit()
+
+    assert sent == [SetCameraSettingCommand(name="Gain", value="3")]
+    assert panel.settings["Gain"].lineedit.text() == ""
+
+
+def test_camera_panel_refresh_requests_all_settings_in_one_command(qtbot):
+    manager = SimpleNamespace(camera_type=SimpleNamespace(settings=["Exposure", "Gain"]))
+    sent = []
+    manager.send_ipc = sent.append
+    panel = CameraPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    panel.callback_refresh()
+    assert sent == [GetCameraSettingsCommand(names=("Exposure", "Gain"))]
+
+    panel.update_camera_settings({"Exposure": "100", "Gain": "2"})
+    assert panel.settings["Exposure"].value_label.text() == "100"
+    assert panel.settings["Gain"].value_label.text() == "2"
+
+
 # ---------------------------------------------------------------------------
 # ScriptPanel
 # ---------------------------------------------------------------------------
@@ -179,6 +479,35 @@ def test_script_panel_update_status_empty(qtbot):
     assert not panel.start_button.isEnabled()
 
 
+def test_script_panel_filepath_is_plain_selectable_label(qtbot):
+    from PyQt6.QtWidgets import QLabel
+
+    manager = SimpleNamespace(send_ipc=lambda c: None)
+    panel = ScriptPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    assert isinstance(panel.filepath_label, QLabel)
+    assert panel.filepath_label.textFormat() == Qt.TextFormat.PlainText
+    panel.update_status(ScriptStatus.EMPTY)
+    assert panel.filepath_label.text() == ScriptPanel.NO_SCRIPT_SELECTED_TEXT
+
+
+def test_script_panel_load_cancel_keeps_current_script(qtbot, monkeypatch):
+    from magscope.ui import controls
+
+    sent = []
+    manager = SimpleNamespace(send_ipc=sent.append)
+    panel = ScriptPanel(manager=manager)
+    qtbot.addWidget(panel)
+    panel.filepath_label.setText('/scripts/current.py')
+    monkeypatch.setattr(controls, 'open_file', lambda *_args: '')
+
+    panel.callback_load()
+
+    assert sent == []
+    assert panel.filepath_label.text() == '/scripts/current.py'
+
+
 def test_script_panel_update_status_loaded(qtbot):
     manager = SimpleNamespace(send_ipc=lambda c: None)
     panel = ScriptPanel(manager=manager)
@@ -434,6 +763,47 @@ def test_acquisition_panel_search_targets(qtbot):
     assert len(targets) > 0
 
 
+def test_acquisition_panel_sends_mode_enum_from_item_data(qtbot):
+    sent = []
+    manager = SimpleNamespace(
+        _acquisition_on=False,
+        _acquisition_mode='Track',
+        _acquisition_dir_on=False,
+        _acquisition_dir='',
+        settings={'acquisition dir default': ''},
+        camera_type=SimpleNamespace(settings=[]),
+        send_ipc=sent.append,
+    )
+    panel = AcquisitionPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    panel.acquisition_mode_combobox.setCurrentText(str(AcquisitionMode.VIDEO_ROIS))
+
+    assert len(sent) == 1
+    assert sent[0].mode is AcquisitionMode.VIDEO_ROIS
+
+
+def test_acquisition_panel_slots_receive_signals_with_extra_args(qtbot):
+    sent = []
+    manager = SimpleNamespace(
+        _acquisition_on=False,
+        _acquisition_mode='Track',
+        _acquisition_dir_on=False,
+        _acquisition_dir='',
+        settings={'acquisition dir default': ''},
+        camera_type=SimpleNamespace(settings=[]),
+        send_ipc=sent.append,
+    )
+    panel = AcquisitionPanel(manager=manager)
+    qtbot.addWidget(panel)
+
+    # toggled(bool) reaches the argument-less @pyqtSlot() callbacks
+    panel.acquisition_on_checkbox.checkbox.setChecked(True)
+    panel.acquisition_dir_on_checkbox.checkbox.setChecked(True)
+
+    assert [command.value for command in sent] == [True, True]
+
+
 def test_bead_selection_panel_search_targets(qtbot):
     from magscope.ui.search import PanelControlTarget
     manager = SimpleNamespace(
@@ -480,6 +850,55 @@ def test_acquisition_panel_set_acquisition_dir_text_none(qtbot):
     assert panel.acquisition_dir_textedit.text() == AcquisitionPanel.NO_DIRECTORY_SELECTED_TEXT
 
 
+def test_shared_settings_are_opened_once():
+    from magscope.ui.settings import shared_settings
+
+    assert shared_settings() is shared_settings()
+
+
+def test_remember_setting_skips_unchanged_values(monkeypatch):
+    from magscope.ui import controls
+
+    writes = []
+    stored = {'last script filepath': '/scripts/a.py'}
+
+    class FakeSettings:
+        def value(self, key, default=None, type=None):
+            return stored.get(key, default)
+
+        def setValue(self, key, value):  # noqa: N802 - Qt naming
+            writes.append((key, value))
+            stored[key] = value
+
+    monkeypatch.setattr(controls, 'shared_settings', lambda: FakeSettings())
+
+    controls._remember_setting('last script filepath', '/scripts/a.py')
+    assert writes == []
+    controls._remember_setting('last script filepath', '/scripts/b.py')
+    assert writes == [('last script filepath', '/scripts/b.py')]
+
+
+def test_open_dir_keeps_native_dialog_and_shows_dirs_only(monkeypatch):
+    from PyQt6.QtWidgets import QFileDialog
+    from magscope.ui import controls
+
+    calls = []
+
+    def fake_get_existing_directory(parent, caption, directory, options):
+        calls.append((caption, directory, options))
+        return '/picked'
+
+    monkeypatch.setattr(QFileDialog, 'getExistingDirectory', fake_get_existing_directory)
+
+    assert controls._open_dir('Select Folder', '/start') == '/picked'
+    (caption, directory, options), = calls
+    assert (caption, directory) == ('Select Folder', '/start')
+    assert not options & QFileDialog.Option.DontUseNativeDialog
+    assert options & QFileDialog.Option.DontUseCustomDirectoryIcons
+    assert options & QFileDialog.Option.DontResolveSymlinks
+    assert options & QFileDialog.Option.ShowDirsOnly
+
+
 def test_acquisition_panel_set_acquisition_dir_text_path(qtbot):
     manager = SimpleNamespace(
         _acquisition_on=False,
@@ -0,0 +1,33 @@
+"""Isolated unit tests for the file dialog helpers in magscope/ui/dialogs.py."""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QFileDialog
+
+from magscope.ui.dialogs import open_file
+
+
+def test_open_file_keeps_native_dialog(monkeypatch):
+    calls = []
+
+    def fake_get_open_file_name(parent, caption, directory, file_filter, options):
+        calls.append((parent, caption, directory, file_filter, options))
+        return '/picked.py', ''
+
+    monkeypatch.setattr(QFileDialog, 'getOpenFileName', fake_get_open_file_name)
+
+    assert open_file('Select Script File', '/start', 'Script (*.py)') == '/picked.py'
+    (parent, caption, directory, file_filter, options), = calls
+    assert parent is None
+    assert (caption, directory, file_filter) == ('Select Script File', '/start', 'Script (*.py)')
+    assert not options & QFileDialog.Option.DontUseNativeDialog
+    assert options & QFileDialog.Option.DontUseCustomDirectoryIcons
+    assert options & QFileDialog.Option.DontResolveSymlinks
+    assert options & QFileDialog.Option.ReadOnly
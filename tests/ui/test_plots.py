@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import SimpleNamespace
 
 import numpy as np
@@ -52,6 +52,7 @@ class FakeLine:
 class FakeAxes:
     def __init__(self):
         self.xaxis = FakeAxisDirection()
+        self.bbox = SimpleNamespace(width=800.0)
         self.yaxis = FakeAxisDirection()
         self.facecolor = None
         self.margin_calls = []
@@ -272,6 +273,28 @@ def test_plot_worker_run_stops_after_one_loop(monkeypatch):
     assert worker._is_running is False
 
 
+def test_plot_worker_run_schedules_renders_without_blocking(qtbot):
+    worker = PlotWorker()
+    renders = []
+    worker.do_main_loop = lambda: renders.append(True)
+
+    worker.run()
+
+    assert renders == [True]
+    assert worker._tick_timer.isSingleShot()
+    assert worker._tick_timer.isActive()
+
+    worker.update_on = False
+    worker._tick()
+    assert renders == [True]
+    assert worker._tick_timer.interval() == PlotWorker.IDLE_POLL_MS
+
+    worker._tick_timer.stop()
+    worker._stop()
+    worker._tick()
+    assert not worker._tick_timer.isActive()
+
+
 def test_plot_worker_do_main_loop_returns_when_updates_disabled():
     worker = PlotWorker()
     worker.update_on = False
@@ -314,7 +337,6 @@ def test_plot_worker_do_main_loop_uses_one_tracks_snapshot_and_emits_qimage(qtbo
     emitted_images = []
     worker.image_signal.connect(emitted_images.append)
 
-    monkeypatch.setattr(plots_module, 'sleep', lambda _seconds: None)
     monkeypatch.setattr(plots_module, 'time', lambda: 10.0)
 
     worker.do_main_loop()
@@ -329,6 +351,57 @@ def test_plot_worker_do_main_loop_uses_one_tracks_snapshot_and_emits_qimage(qtbo
     assert emitted_images[0].devicePixelRatio() == pytest.approx(1.75)
 
 
+def test_plot_worker_do_main_loop_skips_render_until_data_or_view_changes(qtbot):
+    class IndexedTracksBuffer(FakeTracksBuffer):
+        def __init__(self, data: np.ndarray):
+            super().__init__(data)
+            self.write_index = 0
+
+        def get_write_index(self) -> int:
+            return self.write_index
+
+    class CountingTracksPlot(TracksTimeSeriesPlot):
+        def __init__(self):
+            super().__init__('X')
+            self.update_calls = 0
+
+        def update(self) -> None:
+            self.update_calls += 1
+
+    canvas = FakeCanvas()
+    worker = PlotWorker()
+    worker.canvas = canvas
+    worker._recreate_figure_if_needed = lambda: None
+    plot = CountingTracksPlot()
+    plot.parent = worker
+    plot.buffer = IndexedTracksBuffer(np.zeros((1, 7), dtype=np.float64))
+    worker.plots = [plot]
+    emitted_images = []
+    worker.image_signal.connect(emitted_images.append)
+
+    assert worker.do_main_loop() is True
+    assert worker.do_main_loop() is False
+    assert (plot.update_calls, canvas.draw_calls, len(emitted_images)) == (1, 1, 1)
+
+    plot.buffer.write_index = 56
+    assert worker.do_main_loop() is True
+
+    worker._set_selected_bead(3)
+    assert worker.do_main_loop() is True
+
+    worker._set_limits({'X (nm)': (0.0, 1.0)})
+    assert worker.do_main_loop() is True
+    assert worker.do_main_loop() is False
+    assert (plot.update_calls, canvas.draw_calls, len(emitted_images)) == (4, 4, 4)
+
+    worker._is_running = True
+    worker._tick_timer = plots_module.QTimer(worker)
+    worker._tick_timer.setSingleShot(True)
+    worker._tick()
+    assert worker._tick_timer.interval() == PlotWorker.IDLE_POLL_MS
+    worker._tick_timer.stop()
+
+
 def test_plot_worker_dispose_clears_resources_and_ignores_teardown_errors():
     worker = PlotWorker()
     canvas = FakeTeardownCanvas()
@@ -438,6 +511,12 @@ def test_time_series_plot_base_setup_constructs_matrix_buffer_and_sets_ylabel(mo
     assert axes.ylabel == 'Position (nm)'
 
 
+def test_format_relative_time_matches_utc_clock_format():
+    for seconds in (0.0, 59.9, 61.0, 3725.5, 86399.0, 86400.0, 90061.0, -0.5, -10.0):
+        expected = (datetime(1970, 1, 1) + timedelta(seconds=seconds)).strftime('%H:%M:%S')
+        assert plots_module._format_relative_time(seconds, None) == expected
+
+
 def test_tracks_time_series_plot_setup_creates_line(monkeypatch):
     class FakeMatrixBuffer:
         def __init__(self, *args, **kwargs):
@@ -491,6 +570,184 @@ def test_tracks_time_series_plot_treats_reference_minus_one_as_no_reference():
     np.testing.assert_allclose(plot.line.ydata, np.asarray([10.0]))
 
 
+def test_tracks_time_series_plot_drops_non_finite_timestamps():
+    plot = make_tracks_plot(
+        'X',
+        np.asarray(
+            [
+                [np.nan, 1.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [3.0, 30.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [-np.inf, 2.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [2.0, 20.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [np.inf, 4.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [np.nan, 5.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+            ],
+            dtype=np.float64,
+        ),
+    )
+
+    plot.update()
+
+    assert plot.line.xdata == [datetime.fromtimestamp(2.0), datetime.fromtimestamp(3.0)]
+    np.testing.assert_allclose(plot.line.ydata, np.asarray([20.0, 30.0]))
+
+
+def test_sorted_intersect_matches_intersect1d_indices():
+    a = np.asarray([1.0, 2.0, 4.0, 7.0, 9.0])
+    b = np.asarray([0.0, 2.0, 3.0, 7.0, 8.0, 9.0, 12.0, 15.0])
+
+    _, expected_a, expected_b = np.intersect1d(a, b, assume_unique=True, return_indices=True)
+
+    index_a, index_b = plots_module._sorted_intersect(a, b)
+    np.testing.assert_array_equal(index_a, expected_a)
+    np.testing.assert_array_equal(index_b, expected_b)
+
+    index_b, index_a = plots_module._sorted_intersect(b, a)
+    np.testing.assert_array_equal(index_a, expected_a)
+    np.testing.assert_array_equal(index_b, expected_b)
+
+    index_a, index_b = plots_module._sorted_intersect(a, np.asarray([]))
+    assert index_a.size == 0 and index_b.size == 0
+
+
+def test_tracks_time_series_plot_subtracts_reference_at_shared_timestamps():
+    plot = make_tracks_plot(
+        'X',
+        np.asarray(
+            [
+                [3.0, 30.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [1.0, 10.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [2.0, 5.0, 0.0, 0.0, 8.0, 0.0, 0.0],
+                [2.0, 20.0, 0.0, 0.0, 7.0, 0.0, 0.0],
+                [3.0, 6.0, 0.0, 0.0, 8.0, 0.0, 0.0],
+                [4.0, 7.0, 0.0, 0.0, 8.0, 0.0, 0.0],
+            ],
+            dtype=np.float64,
+        ),
+        reference=8,
+    )
+
+    plot.update()
+
+    assert plot.line.xdata == [datetime.fromtimestamp(2.0), datetime.fromtimestamp(3.0)]
+    np.testing.assert_allclose(plot.line.ydata, np.asarray([15.0, 24.0]))
+
+
+def test_m4_downsample_keeps_each_columns_first_last_and_extremes():
+    t = np.arange(12, dtype=np.float64)
+    v = np.asarray([5.0, 9.0, 1.0, 4.0, 2.0, 3.0, 8.0, 0.0, 6.0, 7.0, np.nan, 2.0])
+
+    t_out, v_out = plots_module._m4_downsample(t, v, 2)
+
+    # Columns cover t 0-5 and 6-11; NaN does not hide the second one's extremes
+    np.testing.assert_array_equal(t_out, np.asarray([0.0, 1.0, 2.0, 5.0, 6.0, 7.0, 11.0]))
+    np.testing.assert_array_equal(v_out, np.asarray([5.0, 9.0, 1.0, 3.0, 8.0, 0.0, 2.0]))
+
+    t_short, v_short = plots_module._m4_downsample(t, v, 3)
+    assert t_short is t
+    assert v_short is v
+
+
+def test_m4_downsample_splits_columns_by_time():
+    t = np.concatenate((np.arange(10, dtype=np.float64), [100.0]))
+    v = np.arange(11, dtype=np.float64)
+
+    t_out, _ = plots_module._m4_downsample(t, v, 2)
+
+    # Ten samples share the first column; the lone late sample keeps its own
+    np.testing.assert_array_equal(t_out, np.asarray([0.0, 9.0, 100.0]))
+
+
+def test_tracks_time_series_plot_downsamples_to_axes_width():
+    n = 1000
+    data = np.zeros((n, 7), dtype=np.float64)
+    data[:, 0] = np.arange(n, dtype=np.float64)
+    data[:, 1] = np.sin(np.arange(n, dtype=np.float64))
+    data[:, 4] = 7.0
+    plot = make_tracks_plot('X', data)
+    plot.parent.time_mode = 'relative'
+    plot.parent.relative_window_seconds = None
+    plot.axes.bbox = SimpleNamespace(width=50.0)
+
+    plot.update()
+
+    assert len(plot.line.xdata) <= 200
+    assert plot.line.xdata[0] == 0.0
+    assert plot.line.xdata[-1] == n - 1
+    assert np.all(np.diff(plot.line.xdata) > 0)
+    assert np.max(plot.line.ydata) == np.max(data[:, 1])
+    assert np.min(plot.line.ydata) == np.min(data[:, 1])
+
+
+def test_tracks_time_series_plot_bead_track_sorts_only_that_beads_rows():
+    plot = TracksTimeSeriesPlot('Y')
+    data = np.asarray(
+        [
+            [3.0, 0.0, 30.0, 0.0, 7.0, 0.0, 0.0],
+            [1.0, 0.0, 99.0, 0.0, 8.0, 0.0, 0.0],
+            [2.0, 0.0, 20.0, 0.0, 7.0, 0.0, 0.0],
+            [2.0, 0.0, 21.0, 0.0, 7.0, 0.0, 0.0],
+            [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan],
+        ],
+        dtype=np.float64,
+    )
+
+    t, v = plot._bead_track(data, 7, {})
+
+    np.testing.assert_array_equal(t, np.asarray([2.0, 2.0, 3.0]))
+    np.testing.assert_array_equal(v, np.asarray([20.0, 21.0, 30.0]))
+
+
+def test_tracks_time_series_plots_share_bead_rows_for_one_snapshot(monkeypatch):
+    data = np.asarray(
+        [
+            [2.0, 20.0, 200.0, 0.0, 7.0, 0.0, 0.0],
+            [1.0, 10.0, 100.0, 0.0, 7.0, 0.0, 0.0],
+            [1.0, 99.0, 999.0, 0.0, 8.0, 0.0, 0.0],
+        ],
+        dtype=np.float64,
+    )
+    plot_x = make_tracks_plot('X', data)
+    plot_y = make_tracks_plot('Y', data)
+    plot_y.parent = plot_x.parent
+    plot_x.parent._tracks_snapshot = data
+    plot_x.parent._tracks_rows = {}
+
+    plot_x.update()
+    np.testing.assert_array_equal(plot_x.parent._tracks_rows[7], np.asarray([1, 0]))
+
+    def fail_flatnonzero(*args, **kwargs):
+        raise AssertionError('rows should come from the shared cache')
+
+    monkeypatch.setattr(np, 'flatnonzero', fail_flatnonzero)
+    plot_y.update()
+
+    np.testing.assert_allclose(plot_x.line.ydata, np.asarray([10.0, 20.0]))
+    np.testing.assert_allclose(plot_y.line.ydata, np.asarray([100.0, 200.0]))
+    assert plot_x.buffer.peak_unsorted_calls == 0
+    assert plot_y.buffer.peak_unsorted_calls == 0
+
+
+def test_tracks_time_series_plot_flips_referenced_z_track():
+    plot = make_tracks_plot(
+        'Z',
+        np.asarray(
+            [
+                [1.0, 0.0, 0.0, 30.0, 7.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0, 10.0, 8.0, 0.0, 0.0],
+                [2.0, 0.0, 0.0, 50.0, 7.0, 0.0, 0.0],
+                [2.0, 0.0, 0.0, 5.0, 8.0, 0.0, 0.0],
+            ],
+            dtype=np.float64,
+        ),
+        reference=8,
+    )
+
+    plot.update()
+
+    np.testing.assert_allclose(plot.line.ydata, np.asarray([-20.0, -45.0]))
+
+
 def test_tracks_time_series_plot_relative_mode_with_no_selected_data_clears_line():
     plot = make_tracks_plot(
         'X',
@@ -535,6 +792,22 @@ def test_tracks_time_series_plot_resets_y_axis_inversion_when_limit_is_open():
     assert plot.axes.yaxis.inverted is False
 
 
+def test_tracks_time_series_plot_absolute_time_limits_are_inclusive():
+    plot = make_tracks_plot(
+        'X',
+        np.asarray(
+            [[t, 10.0 * t, 0.0, 0.0, 7.0, 0.0, 0.0] for t in (4.0, 1.0, 3.0, 2.0, 5.0)],
+            dtype=np.float64,
+        ),
+        limits={'Time': (2.0, 4.0)},
+    )
+
+    plot.update()
+
+    assert plot.line.xdata == [datetime.fromtimestamp(t) for t in (2.0, 3.0, 4.0)]
+    np.testing.assert_allclose(plot.line.ydata, np.asarray([20.0, 30.0, 40.0]))
+
+
 def test_tracks_time_series_plot_relative_mode_without_window_uses_full_range():
     plot = make_tracks_plot(
         'X',
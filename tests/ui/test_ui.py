@@ -23,6 +23,7 @@ from PyQt6.QtCore import (
     QRect,
     QRectF,
     QSettings,
+    QThreadPool,
     Qt,
 )
 from PyQt6.QtGui import QImage, QPixmap
@@ -41,6 +42,7 @@ from PyQt6.QtWidgets import (
 )
 
 import magscope.app_icon as app_icon
+import magscope.ui.plots as plots_module
 import magscope.ui.ui as ui_module
 from magscope.app_icon import TASKBAR_ICON_RESOURCE, WINDOW_ICON_RESOURCE, load_app_icon
 from magscope.ipc_commands import (
@@ -129,10 +131,12 @@ class StubFocusMotor(FocusMotorBase):
 class FakeStatusPanel:
     def __init__(self):
         self.video_buffer_status = None
+        self.video_buffer_percent = None
         self.video_processors_status = None
         self.display_rate_texts = []
 
-    def update_video_buffer_status(self, text: str) -> None:
+    def update_video_buffer_status(self, percent_full: int, text: str) -> None:
+        self.video_buffer_percent = percent_full
         self.video_buffer_status = text
 
     def update_video_processors_status(self, text: str) -> None:
@@ -192,8 +196,10 @@ class FakeCheckable:
         self.block_calls = []
         self.checked = None
 
-    def blockSignals(self, state: bool) -> None:
+    def blockSignals(self, state: bool) -> bool:
+        previous = bool(self.block_calls) and self.block_calls[-1]
         self.block_calls.append(state)
+        return previous
 
     def setChecked(self, value: bool) -> None:
         self.checked = value
@@ -207,8 +213,10 @@ class FakeTextEdit:
         self.block_calls = []
         self.text = None
 
-    def blockSignals(self, state: bool) -> None:
+    def blockSignals(self, state: bool) -> bool:
+        previous = bool(self.block_calls) and self.block_calls[-1]
         self.block_calls.append(state)
+        return previous
 
     def setText(self, text: str) -> None:
         self.text = text
@@ -222,8 +230,10 @@ class FakeLineEdit:
         self.block_calls = []
         self._text = text
 
-    def blockSignals(self, state: bool) -> None:
+    def blockSignals(self, state: bool) -> bool:
+        previous = bool(self.block_calls) and self.block_calls[-1]
         self.block_calls.append(state)
+        return previous
 
     def setText(self, text: str) -> None:
         self._text = text
@@ -237,8 +247,10 @@ class FakeComboBox:
         self.block_calls = []
         self.current_text = None
 
-    def blockSignals(self, state: bool) -> None:
+    def blockSignals(self, state: bool) -> bool:
+        previous = bool(self.block_calls) and self.block_calls[-1]
         self.block_calls.append(state)
+        return previous
 
     def setCurrentText(self, value: str) -> None:
         self.current_text = value
@@ -535,6 +547,7 @@ class FakeAxisDirection:
 class FakeAxes:
     def __init__(self):
         self.xaxis = FakeAxisDirection()
+        self.bbox = SimpleNamespace(width=800.0)
         self.yaxis = FakeAxisDirection()
         self.xlim = None
         self.ylim = None
@@ -804,6 +817,36 @@ def test_zlut_generation_dialog_close_discards_during_evaluation(zlut_dialog_fac
     assert discard_calls == ['discard']
 
 
+def test_zlut_generation_dialog_coalesces_progress_updates(zlut_dialog_factory):
+    dialog = zlut_dialog_factory()
+
+    dialog.update_progress(1, 10, 5, 100)
+    dialog.update_progress(2, 10, 10, 100, 12.0)
+
+    assert dialog.progress_label.text() == '0 / 0 steps'
+    assert dialog._progress_flush_timer.isActive()
+
+    dialog._flush_progress()
+
+    assert dialog.progress_bar.maximum() == 10
+    assert dialog.progress_bar.value() == 2
+    assert dialog.progress_label.text() == '2 / 10 steps | 10 / 100 captures | Z = 12.0 nm'
+    assert not dialog._progress_flush_timer.isActive()
+
+
+def test_zlut_generation_dialog_mark_starting_resets_previous_progress(zlut_dialog_factory):
+    dialog = zlut_dialog_factory()
+    dialog.update_progress(10, 10, 100, 100)
+    dialog._flush_progress()
+    dialog.update_progress(3, 10, 30, 100)
+
+    dialog.mark_starting()
+
+    assert dialog.progress_bar.value() == 0
+    assert dialog.progress_label.text() == '0 / 0 steps'
+    assert not dialog._progress_flush_timer.isActive()
+
+
 def test_zlut_generation_dialog_force_close_skips_discard_callback(zlut_dialog_factory):
     dialog = zlut_dialog_factory()
 
@@ -1540,6 +1583,13 @@ def test_zlut_load_dialog_ignores_stale_first_response_for_visible_state(
     clear_ui_manager_singleton()
 
 
+def test_zlut_and_viewer_layout_settings_share_the_gui_store():
+    from magscope.ui.settings import shared_settings
+
+    assert UIManager._zlut_settings() is shared_settings()
+    assert UIManager._viewer_layout_settings(None) is shared_settings()
+
+
 def test_update_zlut_metadata_without_pending_request_does_not_remember_filepath():
     clear_ui_manager_singleton()
     settings = QSettings('MagScope', 'MagScope')
@@ -2004,6 +2054,7 @@ def test_current_zlut_dialog_renders_loaded_zlut_preview(qtbot, tmp_path):
     qtbot.addWidget(dialog)
 
     dialog.update_zlut(str(zlut_path), z_min=0.0, z_max=20.0, step_size=10.0, profile_length=2)
+    qtbot.waitUntil(lambda: dialog.axes.get_title() == 'Current Z-LUT', timeout=2000)
 
     assert not hasattr(dialog, 'unload_button')
     assert dialog.filepath_label.text() == f'File: {zlut_path}'
@@ -2034,7 +2085,7 @@ def test_show_current_zlut_reopens_after_close(qtbot, tmp_path):
 
     assert second_dialog is not None
     assert second_dialog is not first_dialog
-    assert second_dialog.axes.get_title() == 'Current Z-LUT'
+    qtbot.waitUntil(lambda: second_dialog.axes.get_title() == 'Current Z-LUT', timeout=2000)
 
     clear_ui_manager_singleton()
 
@@ -2046,8 +2097,27 @@ def test_current_zlut_dialog_handles_malformed_preview_file(qtbot, tmp_path):
     qtbot.addWidget(dialog)
 
     dialog.update_zlut(str(zlut_path))
+    assert dialog.preview_status_label.text() == 'Loading Z-LUT preview...'
+
+    qtbot.waitUntil(
+        lambda: dialog.preview_status_label.text().startswith('Could not load Z-LUT preview:'),
+        timeout=2000,
+    )
+
+
+def test_current_zlut_dialog_ignores_superseded_preview_loads(qtbot, tmp_path):
+    zlut_path = tmp_path / 'zlut.txt'
+    np.savetxt(zlut_path, np.array([[0.0, 10.0], [1.0, 2.0], [3.0, 4.0]]))
+    dialog = CurrentZLUTDialog()
+    qtbot.addWidget(dialog)
+
+    dialog.update_zlut(str(zlut_path))
+    dialog.update_zlut(None)
+    QThreadPool.globalInstance().waitForDone(2000)
+    qtbot.wait(50)
 
-    assert dialog.preview_status_label.text().startswith('Could not load Z-LUT preview:')
+    assert dialog.preview_status_label.text() == 'No Z-LUT loaded'
+    assert dialog.axes.get_title() == 'No Z-LUT preview available'
 
 
 def test_zlut_new_blocks_before_setup_when_no_beads(qtbot, monkeypatch):
@@ -4210,6 +4280,7 @@ def test_status_updates_format_strings(ui_manager):
     ui_manager.update_video_buffer_status()
     ui_manager.update_video_processors_status()
 
+    assert ui_manager.controls.status_panel.video_buffer_percent == 25
     assert ui_manager.controls.status_panel.video_buffer_status == '25% full, 20 max images'
     assert ui_manager.controls.status_panel.video_processors_status == '3/4 busy'
 
@@ -4649,10 +4720,10 @@ def test_tracks_time_series_plot_skips_reference_plotting_on_alignment_error(mon
         _tracks_snapshot=None,
     )
 
-    def bad_intersect1d(*args, **kwargs):
-        return np.asarray([1.0]), np.asarray([10]), np.asarray([0])
+    def bad_intersect(*args, **kwargs):
+        return np.asarray([10]), np.asarray([0])
 
-    monkeypatch.setattr(np, 'intersect1d', bad_intersect1d)
+    monkeypatch.setattr(plots_module, '_sorted_intersect', bad_intersect)
 
     with pytest.warns(RuntimeWarning, match='Duplicate timestamps detected'):
         with pytest.warns(RuntimeWarning, match='Skipping referenced bead track plot update'):
@@ -4928,6 +4999,7 @@ def test_tracks_time_series_plot_update_uses_snapshot_when_available():
         time_mode="absolute",
         relative_window_seconds=300,
         _tracks_snapshot=snapshot,
+        _tracks_rows={},
     )
     # buffer is None — should use snapshot, not crash
     plot.buffer = None
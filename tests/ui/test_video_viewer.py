@@ -238,6 +238,22 @@ def test_reset_view_with_scale_when_has_image(qtbot):
     assert viewer._zoom == 5  # scale != 1 so zoom is preserved
 
 
+def test_set_image_to_default_reuses_one_checkerboard_pixmap(qtbot):
+    first = VideoViewer()
+    second = VideoViewer()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    first.set_image_to_default()
+    second.set_image_to_default()
+
+    pixmap = first._image.pixmap()
+    assert pixmap.width() == pixmap.height() == 128
+    assert second._image.pixmap().cacheKey() == pixmap.cacheKey()
+    assert second._minimap_base.cacheKey() == pixmap.cacheKey()
+    assert first.has_image() and second.has_image()
+
+
 def test_reset_view_no_image(qtbot):
     viewer = VideoViewer()
     qtbot.addWidget(viewer)
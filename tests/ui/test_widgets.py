@@ -12,7 +12,7 @@ pytest.importorskip("PyQt6")
 
 from PyQt6.QtCore import QPointF, QRectF, QSettings, QSize, Qt
 from PyQt6.QtGui import QBrush, QColor, QIntValidator, QResizeEvent, QShowEvent
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
+from PyQt6.QtWidgets import QCheckBox, QVBoxLayout, QWidget
 
 from magscope.ui.widgets import (
     BeadGraphic,
@@ -25,6 +25,8 @@ from magscope.ui.widgets import (
     LabeledLineEditWithValue,
     LabeledStepperLineEdit,
     ResizableLabel,
+    signals_blocked,
+    updates_suspended,
 )
 
 
@@ -214,6 +216,32 @@ def test_labeled_lineedit_validator(qtbot):
     assert widget.lineedit.validator() is validator
 
 
+def test_labeled_lineedit_value_parses_once_per_text_change(qtbot, monkeypatch):
+    widget = LabeledLineEdit(label_text="X", default="1.5")
+    qtbot.addWidget(widget)
+    assert widget.value() == 1.5
+
+    monkeypatch.setattr(widget.lineedit, "text", lambda: "not read")
+    assert widget.value() == 1.5
+    monkeypatch.undo()
+
+    widget.lineedit.setText("")
+    assert widget.value() is None
+    widget.lineedit.setText("-2")
+    assert widget.value() == -2.0
+
+
+def test_labeled_lineedit_callback_sees_fresh_value(qtbot):
+    seen = []
+    widget = LabeledLineEdit(label_text="X", default="1", callback=lambda _text: seen.append(widget.value()))
+    qtbot.addWidget(widget)
+    assert widget.value() == 1.0
+
+    widget.lineedit.setText("2.5")
+
+    assert seen == [2.5]
+
+
 def test_labeled_lineedit_applies_widths(qtbot):
     widget = LabeledLineEdit(label_text="X", widths=(70, 90))
     qtbot.addWidget(widget)
@@ -361,14 +389,15 @@ def test_flash_label_starts_timer_on_new_text(qtbot):
     label = FlashLabel("Initial")
     qtbot.addWidget(label)
     label.setText("New text")
-    assert label._timer.isActive()
+    assert label.is_flashing
+    assert FlashLabel._shared_timer.isActive()
 
 
 def test_flash_label_does_not_restart_for_same_text(qtbot):
     label = FlashLabel("Hello")
     qtbot.addWidget(label)
     label.setText("Hello")
-    assert not label._timer.isActive()
+    assert not label.is_flashing
 
 
 def test_flash_label_update_flash_interpolates_colors(qtbot):
@@ -387,7 +416,7 @@ def test_flash_label_flash_completes_after_40_steps(qtbot):
     label.setText("Trigger")
     label._step = 39
     label._update_flash()
-    assert label._timer.isActive() is False
+    assert label.is_flashing is False
     assert label.styleSheet() == 'color: white;'
 
 
@@ -399,10 +428,25 @@ def test_flash_label_restarts_active_timer_on_new_text(qtbot):
 
     label.setText("Second")
 
-    assert label._timer.isActive()
+    assert label.is_flashing
     assert label._step == 0
 
 
+def test_flash_labels_share_one_timer_that_stops_when_idle(qtbot):
+    first = FlashLabel("a")
+    second = FlashLabel("b")
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    first.setText("a2")
+    second.setText("b2")
+    assert first.is_flashing and second.is_flashing
+
+    qtbot.waitUntil(lambda: not first.is_flashing and not second.is_flashing, timeout=3000)
+    assert not FlashLabel._shared_timer.isActive()
+    assert first.styleSheet() == second.styleSheet() == 'color: white;'
+
+
 def test_flash_label_update_flash_fades_after_peak(qtbot):
     label = FlashLabel("Test")
     qtbot.addWidget(label)
@@ -487,6 +531,20 @@ def test_collapsible_groupbox_reset_to_default(qtbot):
     assert box.collapsed is True
 
 
+def test_collapsible_groupbox_emits_collapsed_changed_only_on_change(qtbot):
+    box = CollapsibleGroupBox(title="Signal Panel", collapsed=False)
+    qtbot.addWidget(box)
+    box.reset_to_default()
+    emitted = []
+    box.collapsed_changed.connect(emitted.append)
+
+    box.reset_to_default()
+    box.default_collapsed = True
+    box.reset_to_default()
+
+    assert emitted == [True]
+
+
 def test_collapsible_groupbox_set_highlight_border(qtbot):
     box = CollapsibleGroupBox(title="Panel")
     qtbot.addWidget(box)
@@ -1041,3 +1099,35 @@ def test_bead_graphic_paint_draws_roi_and_selected_corner_grips():
     assert painter.saved is True
     assert painter.restored is True
     assert len(painter.rects) == 5
+
+
+def test_signals_blocked_restores_previous_state_on_error(qtbot):
+    first = QCheckBox()
+    second = QCheckBox()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+    second.blockSignals(True)
+    toggled = []
+    first.toggled.connect(toggled.append)
+
+    with pytest.raises(RuntimeError):
+        with signals_blocked(first, second):
+            first.setChecked(True)
+            raise RuntimeError('boom')
+
+    assert toggled == []
+    assert not first.signalsBlocked()
+    assert second.signalsBlocked()
+
+
+def test_updates_suspended_restores_updates_enabled(qtbot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+
+    with updates_suspended(widget):
+        assert not widget.updatesEnabled()
+        with updates_suspended(widget):
+            pass
+        assert not widget.updatesEnabled()
+
+    assert widget.updatesEnabled()